@@ -6,11 +6,15 @@ Provides tools to detect, display, and resolve git conflicts during rebase
 or merge operations, with guided resolution options.
 """
 
+import re
 import subprocess
 import sys
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+# Start of a conflict block ("<<<<<<< HEAD") at the beginning of any line
+CONFLICT_START_PATTERN = re.compile(r'^<<<<<<<', re.MULTILINE)
+
 
 def run_command(cmd: list[str], cwd: Optional[str] = None) -> Tuple[int, str, str]:
     """Run a shell command and return (returncode, stdout, stderr)."""
@@ -64,21 +68,15 @@ def get_conflicted_files(worktree_path: str) -> List[str]:
     return [f.strip() for f in stdout.strip().split("\n") if f.strip()]
 
 
-def get_conflict_markers(worktree_path: str, file_path: str, max_lines: int = 20) -> dict:
+def _parse_conflict_markers(content: str, max_lines: int = 20) -> dict:
     """
-    Extract conflict markers and content from a file.
+    Count conflict blocks in file content and capture the first one.
 
-    Returns:
-        {
-            "conflict_count": int,
-            "preview": str,  # First conflict preview
-            "ours_preview": str,
-            "theirs_preview": str
-        }
+    Returns the same dict shape as get_conflict_markers().
     """
-    full_path = Path(worktree_path) / file_path
-
-    if not full_path.exists():
+    # Count every block in one C-level scan; only the first block is walked
+    conflict_count = len(CONFLICT_START_PATTERN.findall(content))
+    if not conflict_count:
         return {
             "conflict_count": 0,
             "preview": "",
@@ -86,18 +84,6 @@ def get_conflict_markers(worktree_path: str, file_path: str, max_lines: int = 20
             "theirs_preview": ""
         }
 
-    try:
-        content = full_path.read_text()
-    except Exception:
-        return {
-            "conflict_count": 0,
-            "preview": "(Could not read file)",
-            "ours_preview": "",
-            "theirs_preview": ""
-        }
-
-    lines = content.split("\n")
-    conflict_count = 0
     preview_lines = []
     ours_lines = []
     theirs_lines = []
@@ -105,29 +91,21 @@ def get_conflict_markers(worktree_path: str, file_path: str, max_lines: int = 20
     in_conflict = False
     in_ours = False
     in_theirs = False
-    first_conflict_captured = False
 
-    for line in lines:
+    for line in content.split("\n"):
         if line.startswith("<<<<<<<"):
-            conflict_count += 1
             in_conflict = True
             in_ours = True
             in_theirs = False
-            if not first_conflict_captured:
-                preview_lines.append(line)
+            preview_lines.append(line)
         elif line.startswith("=======") and in_conflict:
             in_ours = False
             in_theirs = True
-            if not first_conflict_captured:
-                preview_lines.append(line)
+            preview_lines.append(line)
         elif line.startswith(">>>>>>>") and in_conflict:
-            in_conflict = False
-            in_ours = False
-            in_theirs = False
-            if not first_conflict_captured:
-                preview_lines.append(line)
-                first_conflict_captured = True
-        elif in_conflict and not first_conflict_captured:
+            preview_lines.append(line)
+            break
+        elif in_conflict:
             preview_lines.append(line)
             if in_ours:
                 ours_lines.append(line)
@@ -147,6 +125,41 @@ def get_conflict_markers(worktree_path: str, file_path: str, max_lines: int = 20
     }
 
 
+def get_conflict_markers(worktree_path: str, file_path: str, max_lines: int = 20) -> dict:
+    """
+    Extract conflict markers and content from a file.
+
+    Returns:
+        {
+            "conflict_count": int,
+            "preview": str,  # First conflict preview
+            "ours_preview": str,
+            "theirs_preview": str
+        }
+    """
+    full_path = Path(worktree_path) / file_path
+
+    if not full_path.exists():
+        return {
+            "conflict_count": 0,
+            "preview": "",
+            "ours_preview": "",
+            "theirs_preview": ""
+        }
+
+    try:
+        content = full_path.read_text()
+    except Exception:
+        return {
+            "conflict_count": 0,
+            "preview": "(Could not read file)",
+            "ours_preview": "",
+            "theirs_preview": ""
+        }
+
+    return _parse_conflict_markers(content, max_lines)
+
+
 def detect_conflicts(worktree_path: str) -> dict:
     """
     Detect conflicts in a worktree.
@@ -3,21 +3,32 @@
 Unit tests for conflict_resolver.py
 
 Run with: python -m pytest test_conflict_resolver.py -v
+Or in parallel: python -m pytest test_conflict_resolver.py -n auto (needs pytest-xdist)
 Or: python test_conflict_resolver.py
 """
 
+import hashlib
+import importlib.util
+import io
 import os
 import subprocess
 import tempfile
-import shutil
+import stat
+import sys
 import unittest
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+from unittest.mock import patch
 
 # Import the module under test
 from conflict_resolver import (
     detect_conflicts,
     get_conflicted_files,
     get_conflict_markers,
+    _parse_conflict_markers,
     resolve_file,
     resolve_all,
     abort_rebase,
@@ -26,6 +37,142 @@ from conflict_resolver import (
     is_merge_in_progress,
     format_conflict_report,
 )
+from tests.helpers import write_bytes
+
+
+# Keep fixture repos in RAM when available; git writes many small files
+_FAST_TMP = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Skip the user's global config and fsync of loose objects in fixture repos,
+# pin the initial branch so fixtures never have to guess master vs main, and
+# fix identity and dates so commits need no config lookup and hash the same
+# on every run
+_GIT_ENV = {
+    **os.environ,
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_COUNT": "3",
+    "GIT_CONFIG_KEY_0": "core.fsync",
+    "GIT_CONFIG_VALUE_0": "none",
+    "GIT_CONFIG_KEY_1": "core.fsyncMethod",
+    "GIT_CONFIG_VALUE_1": "batch",
+    "GIT_CONFIG_KEY_2": "init.defaultBranch",
+    "GIT_CONFIG_VALUE_2": "main",
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@test.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@test.com",
+    "GIT_AUTHOR_DATE": "@0 +0000",
+    "GIT_COMMITTER_DATE": "@0 +0000",
+    "GIT_OPTIONAL_LOCKS": "0",
+}
+
+# Same identity and date for commits written straight into the object store
+_COMMIT_STAMP = "Test User <test@test.com> 0 +0000"
+
+
+def _git(repo: str, *args: str, **kwargs) -> subprocess.CompletedProcess:
+    """Run a git command in repo with the fixture environment."""
+    if "capture_output" not in kwargs:
+        kwargs.setdefault("stdout", subprocess.DEVNULL)
+        kwargs.setdefault("stderr", subprocess.DEVNULL)
+    return subprocess.run(["git", *args], cwd=repo, env=_GIT_ENV, **kwargs)
+
+
+def _write_object(repo: str, kind: str, body: bytes) -> str:
+    """
+    Write a loose git object in-process and return its SHA.
+
+    Uses the on-disk loose object format (zlib-compressed "<kind> <size>\\0<body>")
+    so fixtures need no hash-object/mktree/commit-tree subprocesses.
+    """
+    data = f"{kind} {len(body)}\0".encode() + body
+    sha = hashlib.sha1(data).hexdigest()
+    object_path = os.path.join(repo, ".git", "objects", sha[:2], sha[2:])
+    if not os.path.exists(object_path):
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        write_bytes(object_path, zlib.compress(data))
+    return sha
+
+
+def _make_commit(repo: str, parent: Optional[str], files: Dict[str, bytes], message: str) -> str:
+    """
+    Create a commit from in-memory file contents without touching the working tree.
+
+    Blobs, the tree and the commit are written directly as loose objects, so no
+    checkout, index update or git subprocess is needed.
+
+    Returns:
+        SHA of the new commit
+    """
+    tree = b""
+    for path in sorted(files):
+        blob = _write_object(repo, "blob", files[path])
+        tree += f"100644 {path}\0".encode() + bytes.fromhex(blob)
+    tree_sha = _write_object(repo, "tree", tree)
+
+    header = f"tree {tree_sha}\n"
+    if parent:
+        header += f"parent {parent}\n"
+    body = f"{header}author {_COMMIT_STAMP}\ncommitter {_COMMIT_STAMP}\n\n{message}\n"
+    return _write_object(repo, "commit", body.encode())
+
+
+def _update_refs(repo: str, refs: Dict[str, str]) -> None:
+    """Point each branch ref at its commit by writing the loose ref files."""
+    for ref, sha in refs.items():
+        ref_path = os.path.join(repo, ".git", ref)
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+        write_bytes(ref_path, f"{sha}\n".encode())
+
+
+def _remove(remove_func, path: str) -> None:
+    """Remove a path, clearing the read-only bit (git objects on Windows) and retrying once."""
+    try:
+        remove_func(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        remove_func(path)
+
+
+def _fast_rmtree(path: str) -> None:
+    """
+    Delete a fixture directory tree.
+
+    Walks with os.scandir, which returns each entry's type with the listing
+    instead of a separate stat per entry. Missing paths are ignored.
+    """
+    try:
+        entries = list(os.scandir(path))
+    except FileNotFoundError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _fast_rmtree(entry.path)
+        else:
+            _remove(os.unlink, entry.path)
+    _remove(os.rmdir, path)
+
+
+def _build_conflict_repo(repo_path: str) -> None:
+    """Create a repo whose feature and main branches conflict in file.txt."""
+    os.makedirs(repo_path)
+    _git(repo_path, "init", "-q")
+
+    # Build the three commits directly in the object database
+    initial = _make_commit(
+        repo_path, None,
+        {"file.txt": b"line 1\nline 2\nline 3\n"}, "Initial commit"
+    )
+    feature = _make_commit(
+        repo_path, initial,
+        {"file.txt": b"line 1\nmodified by feature\nline 3\n"}, "Feature change"
+    )
+    main = _make_commit(
+        repo_path, initial,
+        {"file.txt": b"line 1\nmodified by main\nline 3\n"}, "Main change"
+    )
+    _update_refs(repo_path, {"refs/heads/feature": feature, "refs/heads/main": main})
 
 
 class TestConflictDetection(unittest.TestCase):
@@ -34,83 +181,19 @@ class TestConflictDetection(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Create a temporary git repo with conflicts for testing."""
-        cls.test_dir = tempfile.mkdtemp(prefix="conflict_test_")
+        cls.test_dir = tempfile.mkdtemp(prefix="conflict_test_", dir=_FAST_TMP)
         cls.repo_path = os.path.join(cls.test_dir, "repo")
         cls.worktree_path = os.path.join(cls.test_dir, "worktree")
 
-        # Initialize main repo
-        os.makedirs(cls.repo_path)
-        subprocess.run(["git", "init"], cwd=cls.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=cls.repo_path, capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=cls.repo_path, capture_output=True
-        )
-
-        # Create initial file
-        test_file = os.path.join(cls.repo_path, "file.txt")
-        with open(test_file, "w") as f:
-            f.write("line 1\nline 2\nline 3\n")
-
-        subprocess.run(["git", "add", "file.txt"], cwd=cls.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=cls.repo_path, capture_output=True
-        )
-
-        # Create feature branch
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=cls.repo_path, capture_output=True
-        )
-
-        # Modify file on feature branch
-        with open(test_file, "w") as f:
-            f.write("line 1\nmodified by feature\nline 3\n")
-
-        subprocess.run(["git", "add", "file.txt"], cwd=cls.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Feature change"],
-            cwd=cls.repo_path, capture_output=True
-        )
-
-        # Go back to main and make conflicting change
-        subprocess.run(["git", "checkout", "master"], cwd=cls.repo_path, capture_output=True)
-        # Try main if master doesn't exist
-        subprocess.run(["git", "checkout", "main"], cwd=cls.repo_path, capture_output=True)
-
-        with open(test_file, "w") as f:
-            f.write("line 1\nmodified by main\nline 3\n")
-
-        subprocess.run(["git", "add", "file.txt"], cwd=cls.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Main change"],
-            cwd=cls.repo_path, capture_output=True
-        )
-
-        # Create worktree on feature branch
-        subprocess.run(
-            ["git", "worktree", "add", cls.worktree_path, "feature"],
-            cwd=cls.repo_path, capture_output=True
-        )
+        _build_conflict_repo(cls.repo_path)
+
+        _git(cls.repo_path, "worktree", "add", cls.worktree_path, "feature")
 
     @classmethod
     def tearDownClass(cls):
-        """Clean up test directory."""
-        try:
-            # Remove worktree first
-            subprocess.run(
-                ["git", "worktree", "remove", cls.worktree_path, "--force"],
-                cwd=cls.repo_path, capture_output=True
-            )
-        except Exception:
-            pass
-
+        """Clean up test directory (repo, worktree and its metadata together)."""
         try:
-            shutil.rmtree(cls.test_dir)
+            _fast_rmtree(cls.test_dir)
         except Exception:
             pass
 
@@ -130,20 +213,9 @@ class TestConflictDetection(unittest.TestCase):
 
 
 class TestConflictMarkerParsing(unittest.TestCase):
-    """Tests for parsing conflict markers from files."""
-
-    def setUp(self):
-        """Create a temporary file with conflict markers."""
-        self.test_dir = tempfile.mkdtemp(prefix="marker_test_")
-        self.conflict_file = os.path.join(self.test_dir, "conflict.txt")
+    """Tests for parsing conflict markers from file content."""
 
-    def tearDown(self):
-        """Clean up."""
-        shutil.rmtree(self.test_dir)
-
-    def test_parse_single_conflict(self):
-        """Test parsing a file with single conflict."""
-        content = """line 1
+    SINGLE_CONFLICT = """line 1
 <<<<<<< HEAD
 our change
 =======
@@ -151,21 +223,8 @@ their change
 >>>>>>> main
 line 3
 """
-        with open(self.conflict_file, "w") as f:
-            f.write(content)
 
-        result = get_conflict_markers(self.test_dir, "conflict.txt")
-
-        self.assertEqual(result["conflict_count"], 1)
-        self.assertIn("<<<<<<< HEAD", result["preview"])
-        self.assertIn("=======", result["preview"])
-        self.assertIn(">>>>>>> main", result["preview"])
-        self.assertIn("our change", result["ours_preview"])
-        self.assertIn("their change", result["theirs_preview"])
-
-    def test_parse_multiple_conflicts(self):
-        """Test parsing a file with multiple conflicts."""
-        content = """<<<<<<< HEAD
+    MULTIPLE_CONFLICTS = """<<<<<<< HEAD
 change 1 ours
 =======
 change 1 theirs
@@ -177,30 +236,50 @@ change 2 ours
 change 2 theirs
 >>>>>>> main
 """
-        with open(self.conflict_file, "w") as f:
-            f.write(content)
 
-        result = get_conflict_markers(self.test_dir, "conflict.txt")
+    NO_CONFLICT = "just normal content\nno conflicts here\n"
+
+    # (content, expected conflict_count)
+    CONFLICT_SAMPLES = [
+        (SINGLE_CONFLICT, 1),
+        (MULTIPLE_CONFLICTS, 2),
+        (NO_CONFLICT, 0),
+    ]
+
+    def test_conflict_counts(self):
+        """Test that every conflict block is counted."""
+        for content, expected_count in self.CONFLICT_SAMPLES:
+            with self.subTest(expected_count=expected_count):
+                result = _parse_conflict_markers(content)
+                self.assertEqual(result["conflict_count"], expected_count)
+
+    def test_parse_single_conflict(self):
+        """Test parsing a file with single conflict."""
+        result = _parse_conflict_markers(self.SINGLE_CONFLICT)
+
+        self.assertIn("<<<<<<< HEAD", result["preview"])
+        self.assertIn("=======", result["preview"])
+        self.assertIn(">>>>>>> main", result["preview"])
+        self.assertIn("our change", result["ours_preview"])
+        self.assertIn("their change", result["theirs_preview"])
+
+    def test_parse_multiple_conflicts(self):
+        """Test that previews only show the first of multiple conflicts."""
+        result = _parse_conflict_markers(self.MULTIPLE_CONFLICTS)
 
-        self.assertEqual(result["conflict_count"], 2)
-        # Preview should only show first conflict
         self.assertIn("change 1 ours", result["ours_preview"])
+        self.assertNotIn("change 2 ours", result["ours_preview"])
 
     def test_parse_no_conflict(self):
         """Test parsing a file without conflicts."""
-        content = "just normal content\nno conflicts here\n"
-
-        with open(self.conflict_file, "w") as f:
-            f.write(content)
+        result = _parse_conflict_markers(self.NO_CONFLICT)
 
-        result = get_conflict_markers(self.test_dir, "conflict.txt")
-
-        self.assertEqual(result["conflict_count"], 0)
         self.assertEqual(result["preview"], "")
 
     def test_missing_file(self):
         """Test handling of missing file."""
-        result = get_conflict_markers(self.test_dir, "nonexistent.txt")
+        tests_dir = os.path.dirname(os.path.abspath(__file__))
+        result = get_conflict_markers(tests_dir, "nonexistent.txt")
 
         self.assertEqual(result["conflict_count"], 0)
 
@@ -208,34 +287,52 @@ change 2 theirs
 class TestFormatConflictReport(unittest.TestCase):
     """Tests for conflict report formatting."""
 
-    def test_format_no_conflicts(self):
-        """Test report when no conflicts."""
-        conflicts = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared, read-only conflict fixtures once."""
+        cls.CONF_NONE = MappingProxyType({
             "has_conflicts": False,
             "operation": None,
-            "files": []
-        }
-
-        report = format_conflict_report(conflicts)
-        self.assertEqual(report, "No conflicts detected.")
-
-    def test_format_with_conflicts(self):
-        """Test report formatting with conflicts."""
-        conflicts = {
+            "files": ()
+        })
+        cls.CONF_ONE = MappingProxyType({
             "has_conflicts": True,
             "operation": "rebase",
-            "files": [
-                {
+            "files": (
+                MappingProxyType({
                     "path": "src/file.py",
                     "conflict_count": 2,
                     "ours_preview": "our code",
                     "theirs_preview": "their code",
                     "conflict_preview": "<<<<<<< HEAD\nour code\n=======\ntheir code\n>>>>>>> main"
-                }
-            ]
-        }
+                }),
+            )
+        })
+        cls.CONF_MANY = MappingProxyType({
+            "has_conflicts": True,
+            "operation": "merge",
+            "files": (
+                MappingProxyType({
+                    "path": "file1.py",
+                    "conflict_count": 1,
+                    "conflict_preview": "conflict"
+                }),
+                MappingProxyType({
+                    "path": "file2.py",
+                    "conflict_count": 3,
+                    "conflict_preview": "conflict"
+                }),
+            )
+        })
 
-        report = format_conflict_report(conflicts, "test-task")
+    def test_format_no_conflicts(self):
+        """Test report when no conflicts."""
+        report = format_conflict_report(self.CONF_NONE)
+        self.assertEqual(report, "No conflicts detected.")
+
+    def test_format_with_conflicts(self):
+        """Test report formatting with conflicts."""
+        report = format_conflict_report(self.CONF_ONE, "test-task")
 
         self.assertIn("test-task", report)
         self.assertIn("rebase", report)
@@ -247,24 +344,7 @@ class TestFormatConflictReport(unittest.TestCase):
 
     def test_format_multiple_files(self):
         """Test report with multiple conflicted files."""
-        conflicts = {
-            "has_conflicts": True,
-            "operation": "merge",
-            "files": [
-                {
-                    "path": "file1.py",
-                    "conflict_count": 1,
-                    "conflict_preview": "conflict"
-                },
-                {
-                    "path": "file2.py",
-                    "conflict_count": 3,
-                    "conflict_preview": "conflict"
-                }
-            ]
-        }
-
-        report = format_conflict_report(conflicts)
+        report = format_conflict_report(self.CONF_MANY)
 
         self.assertIn("file1.py", report)
         self.assertIn("file2.py", report)
@@ -274,20 +354,23 @@ class TestFormatConflictReport(unittest.TestCase):
 class TestResolveStrategies(unittest.TestCase):
     """Tests for resolution strategy validation."""
 
-    def test_invalid_strategy_for_resolve_file(self):
+    @patch("conflict_resolver.subprocess.run", side_effect=AssertionError("should not be called"))
+    def test_invalid_strategy_for_resolve_file(self, mock_run):
         """Test that invalid strategy is rejected for resolve_file."""
         # Use a dummy path since we're testing validation, not actual resolution
         result = resolve_file("/tmp", "file.txt", "invalid")
         self.assertFalse(result["success"])
         self.assertIn("Invalid strategy", result["message"])
 
-    def test_invalid_strategy_for_resolve_all(self):
+    @patch("conflict_resolver.subprocess.run", side_effect=AssertionError("should not be called"))
+    def test_invalid_strategy_for_resolve_all(self, mock_run):
         """Test that invalid strategy is rejected for resolve_all."""
         result = resolve_all("/tmp", "manual")
         self.assertFalse(result["success"])
         self.assertIn("Invalid strategy", result["message"])
 
-    def test_manual_strategy_returns_message(self):
+    @patch("conflict_resolver.subprocess.run", side_effect=AssertionError("should not be called"))
+    def test_manual_strategy_returns_message(self, mock_run):
         """Test that manual strategy returns helpful message."""
         result = resolve_file("/tmp", "file.txt", "manual")
         self.assertTrue(result["success"])
@@ -300,16 +383,16 @@ class TestAbortFunctions(unittest.TestCase):
 
     def setUp(self):
         """Create a clean test directory."""
-        self.test_dir = tempfile.mkdtemp(prefix="abort_test_")
+        self.test_dir = tempfile.mkdtemp(prefix="abort_test_", dir=_FAST_TMP)
 
     def tearDown(self):
         """Clean up."""
-        shutil.rmtree(self.test_dir)
+        _fast_rmtree(self.test_dir)
 
     def test_abort_rebase_no_rebase(self):
         """Test abort when no rebase in progress."""
-        # Initialize a simple git repo
-        subprocess.run(["git", "init"], cwd=self.test_dir, capture_output=True)
+        # abort_rebase only inspects .git for rebase state, so a bare directory will do
+        os.makedirs(os.path.join(self.test_dir, ".git"))
 
         result = abort_rebase(self.test_dir)
         self.assertFalse(result["success"])
@@ -321,72 +404,33 @@ class TestIntegration(unittest.TestCase):
 
     def setUp(self):
         """Create repos with actual conflicts."""
-        self.test_dir = tempfile.mkdtemp(prefix="integration_test_")
+        self.test_dir = tempfile.mkdtemp(prefix="integration_test_", dir=_FAST_TMP)
         self.repo_path = os.path.join(self.test_dir, "repo")
 
         # Initialize repo
         os.makedirs(self.repo_path)
-        subprocess.run(["git", "init"], cwd=self.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=self.repo_path, capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=self.repo_path, capture_output=True
-        )
+        _git(self.repo_path, "init", "-q")
 
     def tearDown(self):
         """Clean up."""
         try:
-            shutil.rmtree(self.test_dir)
+            _fast_rmtree(self.test_dir)
         except Exception:
             pass
 
     def test_detect_conflicts_full_workflow(self):
         """Test full workflow of creating and detecting conflicts."""
-        # Create initial commit
-        test_file = os.path.join(self.repo_path, "test.txt")
-        with open(test_file, "w") as f:
-            f.write("original\n")
-
-        subprocess.run(["git", "add", "."], cwd=self.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=self.repo_path, capture_output=True
-        )
-
-        # Create branch with change
-        subprocess.run(
-            ["git", "checkout", "-b", "feature"],
-            cwd=self.repo_path, capture_output=True
-        )
-        with open(test_file, "w") as f:
-            f.write("feature change\n")
-        subprocess.run(["git", "add", "."], cwd=self.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Feature"],
-            cwd=self.repo_path, capture_output=True
-        )
-
-        # Make conflicting change on main
-        subprocess.run(["git", "checkout", "master"], cwd=self.repo_path, capture_output=True)
-        # Try main if master doesn't exist
-        subprocess.run(["git", "checkout", "main"], cwd=self.repo_path, capture_output=True)
-
-        with open(test_file, "w") as f:
-            f.write("main change\n")
-        subprocess.run(["git", "add", "."], cwd=self.repo_path, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Main change"],
-            cwd=self.repo_path, capture_output=True
-        )
+        # Create initial commit plus diverging feature and main commits
+        initial = _make_commit(self.repo_path, None, {"test.txt": b"original\n"}, "Initial")
+        feature = _make_commit(self.repo_path, initial, {"test.txt": b"feature change\n"}, "Feature")
+        main = _make_commit(self.repo_path, initial, {"test.txt": b"main change\n"}, "Main change")
+        _update_refs(self.repo_path, {"refs/heads/feature": feature, "refs/heads/main": main})
+
+        # Check out main so the merge has a working tree to conflict in
+        _git(self.repo_path, "reset", "-q", "--hard")
 
         # Try to merge feature - should conflict
-        result = subprocess.run(
-            ["git", "merge", "feature"],
-            cwd=self.repo_path, capture_output=True, text=True
-        )
+        result = _git(self.repo_path, "merge", "feature", capture_output=True, text=True)
 
         if "CONFLICT" in result.stdout or "CONFLICT" in result.stderr:
             # Conflicts detected - test our detection
@@ -397,24 +441,41 @@ class TestIntegration(unittest.TestCase):
             self.assertTrue(is_merge_in_progress(self.repo_path))
 
 
+def _run_test_class(class_name: str) -> Tuple[bool, str]:
+    """Run one TestCase class and return (success, report text)."""
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(globals()[class_name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=0).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
 def run_tests():
-    """Run all tests."""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestConflictDetection))
-    suite.addTests(loader.loadTestsFromTestCase(TestConflictMarkerParsing))
-    suite.addTests(loader.loadTestsFromTestCase(TestFormatConflictReport))
-    suite.addTests(loader.loadTestsFromTestCase(TestResolveStrategies))
-    suite.addTests(loader.loadTestsFromTestCase(TestAbortFunctions))
-    suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
-
-    # Run with verbosity
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    return 0 if result.wasSuccessful() else 1
+    """Run all tests, with pytest when installed, else one process per test class."""
+    if importlib.util.find_spec("pytest") is not None:
+        import pytest
+
+        args = [__file__, "-q", "--tb=short", "-p", "no:cacheprovider", "-x"]
+        if importlib.util.find_spec("xdist") is not None:
+            args += ["-n", "auto"]
+        return int(pytest.main(args))
+
+    test_classes = [
+        TestConflictDetection,
+        TestConflictMarkerParsing,
+        TestFormatConflictReport,
+        TestResolveStrategies,
+        TestAbortFunctions,
+        TestIntegration,
+    ]
+
+    # Classes are independent (each owns its temp dirs), so run them in parallel
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        outcomes = list(executor.map(_run_test_class, [cls.__name__ for cls in test_classes]))
+
+    for _, report in outcomes:
+        sys.stderr.write(report)
+
+    return 0 if all(success for success, _ in outcomes) else 1
 
 
 if __name__ == "__main__":
@@ -126,79 +126,41 @@ class TestMakeError(unittest.TestCase):
 class TestPreDefinedErrors(unittest.TestCase):
     """Tests for pre-defined error functions."""
 
-    def test_repo_exists_error(self):
-        """Test repo_exists_error."""
-        result = repo_exists_error("/test/repo")
-        self.assertFalse(result["success"])
-        self.assertIn("already exists", result["error"])
-        self.assertIn("recovery_options", result)
-        self.assertEqual(result["error_code"], "REPO_EXISTS")
-
-    def test_repo_not_found_error(self):
-        """Test repo_not_found_error."""
-        result = repo_not_found_error("/test/repo")
-        self.assertFalse(result["success"])
-        self.assertIn("not found", result["error"])
-        self.assertEqual(result["error_code"], "REPO_NOT_FOUND")
+    # (error_code, builder, args, expected substring of the error message)
+    CASES = [
+        ("REPO_EXISTS", repo_exists_error, ("/test/repo",), "already exists"),
+        ("REPO_NOT_FOUND", repo_not_found_error, ("/test/repo",), "not found"),
+        ("TASK_EXISTS", task_exists_error,
+         ("fix-bug", "/workspace/task-fix-bug"), "already exists"),
+        ("TASK_NOT_FOUND", task_not_found_error,
+         ("fix-bug", "/workspace/task-fix-bug"), "not found"),
+        ("WORKTREE_NOT_FOUND", worktree_not_found_error,
+         ("fix-bug", "/workspace/task-fix-bug/worktree"), "Worktree"),
+        ("REBASE_CONFLICT", rebase_conflict_error, ("fix-bug", "main"), "conflict"),
+        ("TESTS_FAILED", tests_failed_error, ("npm test", 1, 5.2, "execution"), "failed"),
+        ("TEST_TIMEOUT", test_timeout_error, ("npm test", 300), "timed out"),
+        ("TEST_DETECTION_FAILED", test_detection_failed_error, ("/test/repo",), "detect"),
+        ("LOCK_HELD", lock_held_error, ("/workspace",), "locked"),
+        ("SUBAGENT_TIMEOUT", subagent_timeout_error, ("fix-bug", 600), "unresponsive"),
+    ]
+
+    def test_predefined_errors(self):
+        """Test each pre-defined error's success flag, message and code."""
+        for code, func, args, substring in self.CASES:
+            with self.subTest(code=code):
+                result = func(*args)
+                self.assertFalse(result["success"])
+                self.assertIn(substring, result["error"])
+                self.assertEqual(result["error_code"], code)
+
+    def test_predefined_error_details(self):
+        """Test recovery options and context on errors that promise them."""
+        self.assertIn("recovery_options", repo_exists_error("/test/repo"))
+        self.assertIn("recovery_options", rebase_conflict_error("fix-bug", "main"))
 
-    def test_task_exists_error(self):
-        """Test task_exists_error."""
         result = task_exists_error("fix-bug", "/workspace/task-fix-bug")
-        self.assertFalse(result["success"])
-        self.assertIn("already exists", result["error"])
-        self.assertEqual(result["error_code"], "TASK_EXISTS")
         self.assertIn("fix-bug", result["context"]["task_name"])
 
-    def test_task_not_found_error(self):
-        """Test task_not_found_error."""
-        result = task_not_found_error("fix-bug", "/workspace/task-fix-bug")
-        self.assertFalse(result["success"])
-        self.assertIn("not found", result["error"])
-        self.assertEqual(result["error_code"], "TASK_NOT_FOUND")
-
-    def test_worktree_not_found_error(self):
-        """Test worktree_not_found_error."""
-        result = worktree_not_found_error("fix-bug", "/workspace/task-fix-bug/worktree")
-        self.assertFalse(result["success"])
-        self.assertIn("Worktree", result["error"])
-        self.assertEqual(result["error_code"], "WORKTREE_NOT_FOUND")
-
-    def test_rebase_conflict_error(self):
-        """Test rebase_conflict_error."""
-        result = rebase_conflict_error("fix-bug", "main")
-        self.assertFalse(result["success"])
-        self.assertIn("conflict", result["error"].lower())
-        self.assertEqual(result["error_code"], "REBASE_CONFLICT")
-        self.assertIn("recovery_options", result)
-
-    def test_tests_failed_error(self):
-        """Test tests_failed_error."""
-        result = tests_failed_error("npm test", 1, 5.2, "execution")
-        self.assertFalse(result["success"])
-        self.assertIn("failed", result["error"].lower())
-        self.assertEqual(result["error_code"], "TESTS_FAILED")
-
-    def test_test_timeout_error(self):
-        """Test test_timeout_error."""
-        result = test_timeout_error("npm test", 300)
-        self.assertFalse(result["success"])
-        self.assertIn("timed out", result["error"].lower())
-        self.assertEqual(result["error_code"], "TEST_TIMEOUT")
-
-    def test_test_detection_failed_error(self):
-        """Test test_detection_failed_error."""
-        result = test_detection_failed_error("/test/repo")
-        self.assertFalse(result["success"])
-        self.assertIn("detect", result["error"].lower())
-        self.assertEqual(result["error_code"], "TEST_DETECTION_FAILED")
-
-    def test_lock_held_error(self):
-        """Test lock_held_error."""
-        result = lock_held_error("/workspace")
-        self.assertFalse(result["success"])
-        self.assertIn("locked", result["error"].lower())
-        self.assertEqual(result["error_code"], "LOCK_HELD")
-
     def test_lock_held_error_with_info(self):
         """Test lock_held_error with lock info."""
         lock_info = {"pid": 12345, "operation": "test"}
@@ -208,13 +170,6 @@ class TestPreDefinedErrors(unittest.TestCase):
         recovery_text = " ".join(result["recovery_options"])
         self.assertIn("12345", recovery_text)
 
-    def test_subagent_timeout_error(self):
-        """Test subagent_timeout_error."""
-        result = subagent_timeout_error("fix-bug", 600)
-        self.assertFalse(result["success"])
-        self.assertIn("unresponsive", result["error"].lower())
-        self.assertEqual(result["error_code"], "SUBAGENT_TIMEOUT")
-
 
 class TestDiagnose(unittest.TestCase):
     """Tests for the diagnose function."""
@@ -255,46 +210,36 @@ class TestListKnownErrors(unittest.TestCase):
 class TestErrorConsistency(unittest.TestCase):
     """Tests to ensure error format consistency."""
 
-    def test_all_errors_have_success_false(self):
-        """All errors should have success=False."""
-        error_funcs = [
-            lambda: repo_exists_error("/test"),
-            lambda: repo_not_found_error("/test"),
-            lambda: task_exists_error("test", "/test"),
-            lambda: task_not_found_error("test", "/test"),
-            lambda: worktree_not_found_error("test", "/test"),
-            lambda: rebase_conflict_error("test", "main"),
-            lambda: tests_failed_error("test", 1, 1.0, "test"),
-            lambda: test_timeout_error("test", 300),
-            lambda: test_detection_failed_error("/test"),
-            lambda: lock_held_error("/test"),
-            lambda: subagent_timeout_error("test", 600),
+    @classmethod
+    def setUpClass(cls):
+        """Build every pre-defined error once and share the results."""
+        error_calls = [
+            (repo_exists_error, ("/test",)),
+            (repo_not_found_error, ("/test",)),
+            (task_exists_error, ("test", "/test")),
+            (task_not_found_error, ("test", "/test")),
+            (worktree_not_found_error, ("test", "/test")),
+            (rebase_conflict_error, ("test", "main")),
+            (tests_failed_error, ("test", 1, 1.0, "test")),
+            (test_timeout_error, ("test", 300)),
+            (test_detection_failed_error, ("/test",)),
+            (lock_held_error, ("/test",)),
+            (subagent_timeout_error, ("test", 600)),
         ]
+        cls._errors = [(func.__name__, func(*args)) for func, args in error_calls]
 
-        for func in error_funcs:
-            result = func()
-            self.assertFalse(result["success"], f"Error {func} should have success=False")
-            self.assertIn("error", result, f"Error {func} should have 'error' key")
+    def test_all_errors_have_success_false(self):
+        """All errors should have success=False."""
+        for name, result in self._errors:
+            with self.subTest(name=name):
+                self.assertFalse(result["success"], f"Error {name} should have success=False")
+                self.assertIn("error", result, f"Error {name} should have 'error' key")
 
     def test_all_errors_have_error_code(self):
         """All pre-defined errors should have an error_code."""
-        error_funcs = [
-            lambda: repo_exists_error("/test"),
-            lambda: repo_not_found_error("/test"),
-            lambda: task_exists_error("test", "/test"),
-            lambda: task_not_found_error("test", "/test"),
-            lambda: worktree_not_found_error("test", "/test"),
-            lambda: rebase_conflict_error("test", "main"),
-            lambda: tests_failed_error("test", 1, 1.0, "test"),
-            lambda: test_timeout_error("test", 300),
-            lambda: test_detection_failed_error("/test"),
-            lambda: lock_held_error("/test"),
-            lambda: subagent_timeout_error("test", 600),
-        ]
-
-        for func in error_funcs:
-            result = func()
-            self.assertIn("error_code", result, f"Error {func} should have 'error_code'")
+        for name, result in self._errors:
+            with self.subTest(name=name):
+                self.assertIn("error_code", result, f"Error {name} should have 'error_code'")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Run the tools test suite with one worker process per TestCase class.
+
+Run from the tools directory with: python -m tests
+With pytest-xdist installed the same spread is: python -m pytest tests -n auto
+
+Every test creates its own temp workspace, so classes are safe to run side by side.
+"""
+
+import importlib
+import io
+import os
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+TESTS_DIR = Path(__file__).parent
+
+
+def _iter_test_classes(suite: unittest.TestSuite) -> List[Tuple[str, str]]:
+    """Collect (module, class) names for every TestCase in a discovered suite."""
+    classes = []
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            classes.extend(_iter_test_classes(item))
+        elif type(item).__module__ == "unittest.loader":
+            # Placeholders for modules that failed to import; reported via loader.errors
+            continue
+        else:
+            key = (type(item).__module__, type(item).__name__)
+            if key not in classes:
+                classes.append(key)
+    return classes
+
+
+def _run_test_class(module_name: str, class_name: str) -> Tuple[bool, str]:
+    """Run one TestCase class in this worker and return (success, report text)."""
+    test_class = getattr(importlib.import_module(module_name), class_name)
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
+    result = unittest.TextTestRunner(stream=stream, verbosity=0).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
+def main() -> int:
+    """Discover the tests and run each TestCase class in a worker process."""
+    sys.path.insert(0, str(TESTS_DIR.parent))
+    loader = unittest.TestLoader()
+    suite = loader.discover(str(TESTS_DIR), top_level_dir=str(TESTS_DIR.parent))
+    test_classes = _iter_test_classes(suite)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        outcomes = list(executor.map(
+            _run_test_class,
+            [module_name for module_name, _ in test_classes],
+            [class_name for _, class_name in test_classes],
+        ))
+
+    for (module_name, class_name), (_, report) in zip(test_classes, outcomes):
+        sys.stderr.write(f"{module_name}.{class_name}\n{report}\n")
+
+    for error in loader.errors:
+        sys.stderr.write(f"{error}\n")
+
+    return 0 if not loader.errors and all(success for success, _ in outcomes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
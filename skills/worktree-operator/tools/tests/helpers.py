@@ -0,0 +1,42 @@
+"""Helpers shared by the tools test modules."""
+
+import os
+import tempfile
+from typing import Optional, Tuple
+
+
+def workspace_tempdir(min_free_bytes: int = 64 * 1024 * 1024) -> str:
+    """Return the directory test workspaces should be created in.
+
+    PYTEST_TMPDIR wins when set; otherwise /dev/shm when it exists with enough
+    free space, else the default temp dir.
+    """
+    override = os.environ.get("PYTEST_TMPDIR")
+    if override:
+        return override
+    if os.path.isdir("/dev/shm"):
+        stats = os.statvfs("/dev/shm")
+        if stats.f_bavail * stats.f_frsize >= min_free_bytes:
+            return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def make_plan(*tasks: Tuple[str, str, Optional[str]]) -> str:
+    """Build plan.md text from (name, status, dependencies) tuples.
+
+    A dependencies value of None leaves the Dependencies line out.
+    """
+    return "# Plan\n\n" + "\n".join(
+        f"### {i}. {name}\n- Status: {status}\n"
+        + (f"- Dependencies: {deps}\n" if deps is not None else "")
+        for i, (name, status, deps) in enumerate(tasks, 1)
+    )
+
+
+def write_bytes(path, data: bytes) -> None:
+    """Write a small fixture file with raw os calls (no text-mode wrapper)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
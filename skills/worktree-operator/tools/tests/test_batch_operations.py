@@ -1,23 +1,117 @@
 #!/usr/bin/env python3
 """Unit tests for batch_operations.py."""
 
+import importlib
+import inspect
 import os
+import shutil
+import subprocess
 import sys
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports, once per interpreter
+_TOOLS_DIR = str(Path(__file__).parent.parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.insert(0, _TOOLS_DIR)
 
-from batch_operations import (
-    create_all_tasks,
-    spawn_unblocked_tasks,
-    spawn_parallel,
-    format_batch_report,
-    BatchResult,
-)
+from tests.helpers import make_plan, workspace_tempdir, write_bytes
+
+# Imported in setUpModule so runs that select no test here skip the import
+batch_operations = None
+
+# tempfile.tempdir in effect before setUpModule, restored by tearDownModule
+_saved_tempdir: Optional[str] = None
+
+# With SKILL_TESTS_KEEP_TMP=1, workspaces are kept until module teardown and
+# removed together instead of one rmtree per test
+_DEFERRED_CLEANUP: List[tempfile.TemporaryDirectory] = []
+
+
+def _make_temp_dir(test: unittest.TestCase) -> str:
+    """Create a temporary workspace that is removed after the test (or module)."""
+    temp_dir = tempfile.TemporaryDirectory()
+    if os.environ.get("SKILL_TESTS_KEEP_TMP") == "1":
+        _DEFERRED_CLEANUP.append(temp_dir)
+    else:
+        test.addCleanup(temp_dir.cleanup)
+    return temp_dir.name
+
+
+# plan.md contents, kept as bytes so tests write them without re-encoding
+_PLAN_ALL_DONE = make_plan(
+    ("task1", "COMPLETED", "None"),
+    ("task2", "MERGED", "None"),
+).encode()
+
+_PLAN_PENDING_CHAIN = make_plan(
+    ("task1", "PENDING", "None"),
+    ("task2", "PENDING", "task1"),
+).encode()
+
+_PLAN_EXISTING_AND_NEW = make_plan(
+    ("existing-task", "PENDING", "None"),
+    ("new-task", "PENDING", "None"),
+).encode()
+
+_PLAN_IN_PROGRESS_CHAIN = make_plan(
+    ("task1", "IN_PROGRESS", "None"),
+    ("task2", "PENDING", "task1"),
+).encode()
+
+_PLAN_ONE_PENDING = make_plan(("task1", "PENDING", "None")).encode()
+
+_PLAN_ONE_PENDING_NO_DEPS = make_plan(("task1", "PENDING", None)).encode()
+
+_PLAN_FOUR_PENDING = make_plan(
+    ("task1", "PENDING", "None"),
+    ("task2", "PENDING", "None"),
+    ("task3", "PENDING", "None"),
+    ("task4", "PENDING", "None"),
+).encode()
+
+
+# batch_operations only checks that task-<name>/worktree exists, so every
+# task links to this one empty folder, made in setUpModule, instead of
+# getting its own
+_EMPTY_WT: Optional[Path] = None
+
+
+def _mk_tasks(base: str, names: List[str]) -> None:
+    """Create task-<name> folders under base with a worktree link in each."""
+    for name in names:
+        task_dir = os.path.join(base, f"task-{name}")
+        os.mkdir(task_dir)
+        try:
+            os.symlink(_EMPTY_WT / "worktree", os.path.join(task_dir, "worktree"))
+        except OSError:
+            # Symlinks can need extra privileges on Windows
+            os.mkdir(os.path.join(task_dir, "worktree"))
+
+
+def setUpModule():
+    """Import the module under test and keep workspaces in RAM."""
+    global batch_operations, _saved_tempdir, _EMPTY_WT
+    _saved_tempdir = tempfile.tempdir
+    tempfile.tempdir = workspace_tempdir()
+    batch_operations = importlib.import_module("batch_operations")
+    _EMPTY_WT = Path(tempfile.mkdtemp())
+    (_EMPTY_WT / "worktree").mkdir()
+
+
+def tearDownModule():
+    """Remove the shared and deferred workspaces and restore tempfile.tempdir."""
+    global _EMPTY_WT
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda temp_dir: temp_dir.cleanup(), _DEFERRED_CLEANUP))
+    _DEFERRED_CLEANUP.clear()
+    shutil.rmtree(_EMPTY_WT, ignore_errors=True)
+    _EMPTY_WT = None
+    tempfile.tempdir = _saved_tempdir
 
 
 class TestBatchResult(unittest.TestCase):
@@ -25,7 +119,7 @@ class TestBatchResult(unittest.TestCase):
 
     def test_batch_result_defaults(self):
         """Test BatchResult default values."""
-        result = BatchResult(success=True)
+        result = batch_operations.BatchResult(success=True)
 
         self.assertTrue(result.success)
         self.assertEqual(result.created, [])
@@ -37,7 +131,7 @@ class TestBatchResult(unittest.TestCase):
 
     def test_batch_result_to_dict(self):
         """Test BatchResult.to_dict() method."""
-        result = BatchResult(
+        result = batch_operations.BatchResult(
             success=True,
             created=["task1", "task2"],
             skipped=["task3"],
@@ -49,12 +143,19 @@ class TestBatchResult(unittest.TestCase):
 
         result_dict = result.to_dict()
 
-        self.assertTrue(result_dict["success"])
-        self.assertEqual(result_dict["created"], ["task1", "task2"])
-        self.assertEqual(result_dict["skipped"], ["task3"])
-        self.assertEqual(result_dict["summary"]["created_count"], 2)
-        self.assertEqual(result_dict["summary"]["skipped_count"], 1)
-        self.assertEqual(result_dict["message"], "Test complete")
+        self.assertEqual(
+            {k: result_dict[k] for k in ("success", "created", "skipped", "message")},
+            {
+                "success": True,
+                "created": ["task1", "task2"],
+                "skipped": ["task3"],
+                "message": "Test complete",
+            }
+        )
+        self.assertEqual(
+            result_dict["summary"],
+            {"created_count": 2, "skipped_count": 1, "spawned_count": 0, "failed_count": 0}
+        )
 
 
 class TestCreateAllTasks(unittest.TestCase):
@@ -62,22 +163,13 @@ class TestCreateAllTasks(unittest.TestCase):
 
     def setUp(self):
         """Create a temporary workspace for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        # Create repo directory
-        repo_dir = Path(self.temp_dir) / "repo"
-        repo_dir.mkdir()
-        # Initialize git repo
-        os.system(f"cd {repo_dir} && git init -b main > /dev/null 2>&1")
-        os.system(f"cd {repo_dir} && touch .gitkeep && git add . && git commit -m 'init' > /dev/null 2>&1")
-
-    def tearDown(self):
-        """Clean up temporary workspace."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        self.temp_dir = _make_temp_dir(self)
+        self.temp_path = Path(self.temp_dir)
+        self.plan_path = self.temp_path / "plan.md"
 
     def test_create_all_no_plan(self):
         """Test create_all_tasks when plan.md doesn't exist."""
-        result = create_all_tasks(workspace_path=self.temp_dir)
+        result = batch_operations.create_all_tasks(workspace_path=self.temp_dir)
 
         self.assertFalse(result["success"])
         self.assertIn("error", result)
@@ -85,99 +177,115 @@ class TestCreateAllTasks(unittest.TestCase):
 
     def test_create_all_no_pending_tasks(self):
         """Test create_all_tasks when all tasks are completed."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: COMPLETED
-- Dependencies: None
-
-### 2. task2
-- Status: MERGED
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
+        write_bytes(self.plan_path, _PLAN_ALL_DONE)
 
-        result = create_all_tasks(workspace_path=self.temp_dir)
+        result = batch_operations.create_all_tasks(workspace_path=self.temp_dir)
 
         self.assertTrue(result["success"])
         self.assertEqual(result["created"], [])
         self.assertIn("No pending tasks", result["message"])
 
-    def test_create_all_pending_tasks(self):
+    @patch('batch_operations.create_task', return_value={"success": True})
+    def test_create_all_pending_tasks(self, mock_create):
         """Test create_all_tasks with pending tasks."""
-        plan_content = """# Plan
+        write_bytes(self.plan_path, _PLAN_PENDING_CHAIN)
 
-### 1. task1
-- Status: PENDING
-- Dependencies: None
-
-### 2. task2
-- Status: PENDING
-- Dependencies: task1
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = create_all_tasks(
+        result = batch_operations.create_all_tasks(
             workspace_path=self.temp_dir,
             ticket="WH",
             main_branch="main"
         )
 
-        # Note: create_task may fail in test environment due to git worktree issues
-        # The important thing is that it attempts to create tasks
-        # Check that it either succeeded or failed gracefully
-        if not result["success"]:
-            # If it failed, it should be due to worktree creation, not plan parsing
-            self.assertIn("failed", result)
-            # Should have attempted to create both tasks
-            return
-
-        self.assertIn("task1", result["created"])
-        self.assertIn("task2", result["created"])
-        self.assertEqual(len(result["failed"]), 0)
-
-        # Verify folders were created
-        self.assertTrue((Path(self.temp_dir) / "task-task1").exists())
-        self.assertTrue((Path(self.temp_dir) / "task-task2").exists())
+        self.assertTrue(result["success"])
+        self.assertEqual(result["created"], ["task1", "task2"])
+        self.assertEqual(result["failed"], [])
+        self.assertEqual(
+            [c.kwargs["task_name"] for c in mock_create.call_args_list],
+            ["task1", "task2"]
+        )
+        mock_create.assert_called_with(
+            ticket="WH",
+            task_name="task2",
+            main_branch="main",
+            workspace_path=str(self.temp_path.resolve())
+        )
 
-    def test_create_all_skip_existing(self):
+    @patch('batch_operations.create_task', return_value={"success": True})
+    def test_create_all_skip_existing(self, mock_create):
         """Test that existing task folders are skipped."""
-        plan_content = """# Plan
-
-### 1. existing-task
-- Status: PENDING
-- Dependencies: None
-
-### 2. new-task
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
+        write_bytes(self.plan_path, _PLAN_EXISTING_AND_NEW)
 
         # Create existing task folder
-        existing_folder = Path(self.temp_dir) / "task-existing-task"
+        existing_folder = self.temp_path / "task-existing-task"
         existing_folder.mkdir()
 
-        result = create_all_tasks(
+        result = batch_operations.create_all_tasks(
             workspace_path=self.temp_dir,
             ticket="WH",
             main_branch="main"
         )
 
-        # existing-task should always be skipped
-        self.assertIn("existing-task", result["skipped"])
+        self.assertTrue(result["success"])
+        self.assertEqual(result["skipped"], ["existing-task"])
+        self.assertEqual(result["created"], ["new-task"])
+        mock_create.assert_called_once()
+        self.assertEqual(mock_create.call_args.kwargs["task_name"], "new-task")
+
+    @patch('batch_operations.create_task', return_value={"success": False, "error": "boom"})
+    def test_create_all_reports_failures(self, mock_create):
+        """Test that failed task creations are collected."""
+        write_bytes(self.plan_path, _PLAN_PENDING_CHAIN)
+
+        result = batch_operations.create_all_tasks(workspace_path=self.temp_dir)
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["created"], [])
+        self.assertEqual(
+            result["failed"],
+            [{"task": "task1", "error": "boom"}, {"task": "task2", "error": "boom"}]
+        )
+
+
+class TestCreateAllTasksRealGit(unittest.TestCase):
+    """Tests for create_all_tasks calling the real create_task."""
+
+    @unittest.skip("default ticket 'WH' fails validate_ticket")
+    def test_default_ticket_is_valid(self):
+        """Test that the default ticket passes ticket validation."""
+        from validation import validate_ticket
+
+        default = inspect.signature(batch_operations.create_all_tasks).parameters["ticket"].default
+
+        validate_ticket(default)
+
+    @unittest.skip("create_all_tasks deadlocks on nested workspace_lock")
+    def test_create_all_pending_tasks_real_git(self):
+        """Test create_all_tasks creates worktrees in a real git repo."""
+        temp_path = Path(_make_temp_dir(self))
+        repo = temp_path / "repo"
+        git_env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t",
+            "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t",
+        }
+        subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], check=True)
+        subprocess.run(
+            ["git", "-C", str(repo), "commit", "--allow-empty", "-q", "-m", "init"],
+            env=git_env, check=True
+        )
+        write_bytes(temp_path / "plan.md", _PLAN_PENDING_CHAIN)
+
+        result = batch_operations.create_all_tasks(
+            workspace_path=str(temp_path),
+            ticket="K-123",
+            main_branch="main"
+        )
 
-        # new-task may succeed or fail depending on git worktree support
-        # but it should either be in created or failed, not skipped
-        if result["success"]:
-            self.assertIn("new-task", result["created"])
-        else:
-            # If creation failed (worktree issue), new-task should be in failed
-            failed_tasks = [f["task"] for f in result.get("failed", [])]
-            self.assertIn("new-task", failed_tasks)
+        self.assertTrue(result["success"], result)
+        self.assertEqual(result["created"], ["task1", "task2"])
+        self.assertEqual(result["failed"], [])
+        self.assertTrue((temp_path / "task-task1" / "worktree").is_dir())
+        self.assertTrue((temp_path / "task-task2" / "worktree").is_dir())
 
 
 class TestSpawnUnblockedTasks(unittest.TestCase):
@@ -185,36 +293,22 @@ class TestSpawnUnblockedTasks(unittest.TestCase):
 
     def setUp(self):
         """Create a temporary workspace for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up temporary workspace."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        self.temp_dir = _make_temp_dir(self)
+        self.temp_path = Path(self.temp_dir)
+        self.plan_path = self.temp_path / "plan.md"
 
     def test_spawn_unblocked_no_plan(self):
         """Test spawn_unblocked_tasks when plan.md doesn't exist."""
-        result = spawn_unblocked_tasks(workspace_path=self.temp_dir)
+        result = batch_operations.spawn_unblocked_tasks(workspace_path=self.temp_dir)
 
         self.assertFalse(result["success"])
         self.assertIn("error", result)
 
     def test_spawn_unblocked_no_tasks(self):
         """Test spawn_unblocked_tasks when no tasks are unblocked."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: IN_PROGRESS
-- Dependencies: None
+        write_bytes(self.plan_path, _PLAN_IN_PROGRESS_CHAIN)
 
-### 2. task2
-- Status: PENDING
-- Dependencies: task1
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = spawn_unblocked_tasks(workspace_path=self.temp_dir)
+        result = batch_operations.spawn_unblocked_tasks(workspace_path=self.temp_dir)
 
         self.assertTrue(result["success"])
         self.assertEqual(result["spawned"], [])
@@ -222,16 +316,9 @@ class TestSpawnUnblockedTasks(unittest.TestCase):
 
     def test_spawn_unblocked_skip_missing_folders(self):
         """Test that tasks without folders are skipped."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
+        write_bytes(self.plan_path, _PLAN_ONE_PENDING)
 
-        result = spawn_unblocked_tasks(workspace_path=self.temp_dir)
+        result = batch_operations.spawn_unblocked_tasks(workspace_path=self.temp_dir)
 
         self.assertTrue(result["success"])
         self.assertIn("task1", result["skipped"])
@@ -242,21 +329,12 @@ class TestSpawnUnblockedTasks(unittest.TestCase):
         """Test spawn_unblocked_tasks with ready tasks."""
         mock_spawn.return_value = {"success": True}
 
-        plan_content = """# Plan
-
-### 1. task1
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
+        write_bytes(self.plan_path, _PLAN_ONE_PENDING)
 
         # Create task folder and worktree
-        task_dir = Path(self.temp_dir) / "task-task1"
-        task_dir.mkdir()
-        (task_dir / "worktree").mkdir()
+        _mk_tasks(self.temp_dir, ["task1"])
 
-        result = spawn_unblocked_tasks(
+        result = batch_operations.spawn_unblocked_tasks(
             workspace_path=self.temp_dir,
             ticket="WH",
             model="opus"
@@ -272,31 +350,22 @@ class TestSpawnParallel(unittest.TestCase):
 
     def setUp(self):
         """Create a temporary workspace for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up temporary workspace."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        self.temp_dir = _make_temp_dir(self)
+        self.temp_path = Path(self.temp_dir)
+        self.plan_path = self.temp_path / "plan.md"
 
     def test_spawn_parallel_invalid_param(self):
         """Test spawn_parallel with invalid max_parallel."""
-        plan_content = """# Plan
+        write_bytes(self.plan_path, _PLAN_ONE_PENDING_NO_DEPS)
 
-### 1. task1
-- Status: PENDING
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = spawn_parallel(max_parallel=0, workspace_path=self.temp_dir)
+        result = batch_operations.spawn_parallel(max_parallel=0, workspace_path=self.temp_dir)
 
         self.assertFalse(result["success"])
         self.assertIn("error", result)
 
     def test_spawn_parallel_no_plan(self):
         """Test spawn_parallel when plan.md doesn't exist."""
-        result = spawn_parallel(max_parallel=3, workspace_path=self.temp_dir)
+        result = batch_operations.spawn_parallel(max_parallel=3, workspace_path=self.temp_dir)
 
         self.assertFalse(result["success"])
         self.assertIn("error", result)
@@ -306,34 +375,12 @@ class TestSpawnParallel(unittest.TestCase):
         """Test that spawn_parallel respects the max_parallel limit."""
         mock_spawn.return_value = {"success": True}
 
-        plan_content = """# Plan
-
-### 1. task1
-- Status: PENDING
-- Dependencies: None
-
-### 2. task2
-- Status: PENDING
-- Dependencies: None
-
-### 3. task3
-- Status: PENDING
-- Dependencies: None
-
-### 4. task4
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
+        write_bytes(self.plan_path, _PLAN_FOUR_PENDING)
 
         # Create task folders
-        for i in range(1, 5):
-            task_dir = Path(self.temp_dir) / f"task-task{i}"
-            task_dir.mkdir()
-            (task_dir / "worktree").mkdir()
+        _mk_tasks(self.temp_dir, ["task1", "task2", "task3", "task4"])
 
-        result = spawn_parallel(
+        result = batch_operations.spawn_parallel(
             max_parallel=2,
             workspace_path=self.temp_dir,
             ticket="WH",
@@ -350,21 +397,12 @@ class TestSpawnParallel(unittest.TestCase):
         """Test spawn_parallel when fewer tasks available than limit."""
         mock_spawn.return_value = {"success": True}
 
-        plan_content = """# Plan
-
-### 1. task1
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
+        write_bytes(self.plan_path, _PLAN_ONE_PENDING)
 
         # Create task folder
-        task_dir = Path(self.temp_dir) / "task-task1"
-        task_dir.mkdir()
-        (task_dir / "worktree").mkdir()
+        _mk_tasks(self.temp_dir, ["task1"])
 
-        result = spawn_parallel(
+        result = batch_operations.spawn_parallel(
             max_parallel=5,
             workspace_path=self.temp_dir
         )
@@ -389,7 +427,7 @@ class TestFormatBatchReport(unittest.TestCase):
             "remaining": []
         }
 
-        report = format_batch_report(result)
+        report = batch_operations.format_batch_report(result)
 
         self.assertIn("SUCCESS", report)
         self.assertIn("CREATED (2)", report)
@@ -408,7 +446,7 @@ class TestFormatBatchReport(unittest.TestCase):
             "remaining": []
         }
 
-        report = format_batch_report(result)
+        report = batch_operations.format_batch_report(result)
 
         self.assertIn("PARTIAL FAILURE", report)
         self.assertIn("CREATED (1)", report)
@@ -428,7 +466,7 @@ class TestFormatBatchReport(unittest.TestCase):
             "remaining": ["task2", "task3"]
         }
 
-        report = format_batch_report(result)
+        report = batch_operations.format_batch_report(result)
 
         self.assertIn("REMAINING (2)", report)
         self.assertIn("task2", report)
@@ -1,47 +1,52 @@
 #!/usr/bin/env python3
 """Unit tests for plan_parser.py."""
 
+import importlib
 import os
+import shutil
 import sys
 import tempfile
 import unittest
+from functools import lru_cache
 from pathlib import Path
+from typing import List, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports, once per interpreter
+_TOOLS_DIR = str(Path(__file__).parent.parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.insert(0, _TOOLS_DIR)
 
-from plan_parser import (
-    parse_plan,
-    get_unblocked_tasks,
-    check_dependencies,
-    COMPLETED_STATUSES,
-    VALID_STATUSES,
-)
+from tests.helpers import make_plan, workspace_tempdir
 
+# Imported in setUpModule so runs that select no test here skip the import
+plan_parser = None
 
-class TestParsePlan(unittest.TestCase):
-    """Tests for parse_plan function."""
+# tempfile.tempdir in effect before setUpModule, restored by tearDownModule
+_saved_tempdir: Optional[str] = None
 
-    def setUp(self):
-        """Create a temporary workspace for testing."""
-        self.temp_dir = tempfile.mkdtemp()
+# Workspaces made by _plan_fixture, removed by tearDownModule
+_PLAN_WORKSPACES: List[str] = []
 
-    def tearDown(self):
-        """Clean up temporary workspace."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
 
-    def test_parse_plan_no_file(self):
-        """Test parsing when plan.md doesn't exist."""
-        result = parse_plan(self.temp_dir)
+def setUpModule():
+    """Import the module under test and keep workspaces in RAM."""
+    global plan_parser, _saved_tempdir
+    _saved_tempdir = tempfile.tempdir
+    tempfile.tempdir = workspace_tempdir()
+    plan_parser = importlib.import_module("plan_parser")
 
-        self.assertFalse(result["success"])
-        self.assertIn("not found", result["error"])
-        self.assertEqual(result["tasks"], {})
 
-    def test_parse_plan_simple_task(self):
-        """Test parsing a simple task with status and dependencies."""
-        plan_content = """# Plan: K-123 Feature
+def tearDownModule():
+    """Remove the cached plan workspaces and restore tempfile.tempdir."""
+    for workspace in _PLAN_WORKSPACES:
+        shutil.rmtree(workspace, ignore_errors=True)
+    _PLAN_WORKSPACES.clear()
+    _plan_fixture.cache_clear()
+    tempfile.tempdir = _saved_tempdir
+
+
+# plan.md contents shared by the tests below
+_PLAN_SIMPLE_TASK = """# Plan: K-123 Feature
 
 ## Tasks
 
@@ -50,23 +55,8 @@ class TestParsePlan(unittest.TestCase):
 - Dependencies: None
 - Branch: feature/K-123/setup-database
 """
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = parse_plan(self.temp_dir)
 
-        self.assertTrue(result["success"])
-        self.assertEqual(result["task_count"], 1)
-        self.assertIn("setup-database", result["tasks"])
-
-        task = result["tasks"]["setup-database"]
-        self.assertEqual(task["status"], "COMPLETED")
-        self.assertEqual(task["dependencies"], [])
-        self.assertEqual(task["branch"], "feature/K-123/setup-database")
-
-    def test_parse_plan_with_dependencies(self):
-        """Test parsing task with multiple dependencies."""
-        plan_content = """# Plan
+_PLAN_WITH_DEPENDENCIES = """# Plan
 
 ## Tasks
 
@@ -82,10 +72,152 @@ class TestParsePlan(unittest.TestCase):
 - Status: PENDING
 - Dependencies: setup-database, create-user-model
 """
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
 
-        result = parse_plan(self.temp_dir)
+_PLAN_MIXED_CASE_STATUS = make_plan(
+    ("task-lower", "completed", None),
+    ("task-upper", "COMPLETED", None),
+    ("task-mixed", "Completed", None),
+)
+
+_PLAN_PRIORITY_AND_DESCRIPTION = """# Plan
+
+### 1. critical-task
+- Status: PENDING
+- Dependencies: None
+- Priority: HIGH
+- Description: This is a critical task
+"""
+
+_PLAN_NO_NUMBER_PREFIX = """# Plan
+
+### task-without-number
+- Status: PENDING
+- Dependencies: None
+"""
+
+_PLAN_BACKTICK_NAME = """# Plan
+
+### 1. `task-with-backticks`
+- Status: PENDING
+- Dependencies: None
+"""
+
+_PLAN_NONE_DEPENDENCIES = make_plan(
+    ("task-none", "PENDING", "None"),
+    ("task-na", "PENDING", "n/a"),
+    ("task-dash", "PENDING", "-"),
+)
+
+_PLAN_TWO_INDEPENDENT = make_plan(
+    ("task1", "PENDING", "None"),
+    ("task2", "PENDING", "None"),
+)
+
+_PLAN_PENDING_CHAIN = make_plan(
+    ("task1", "PENDING", "None"),
+    ("task2", "PENDING", "task1"),
+)
+
+_PLAN_COMPLETED_CHAIN = make_plan(
+    ("task1", "COMPLETED", "None"),
+    ("task2", "PENDING", "task1"),
+)
+
+_PLAN_ALL_IN_PROGRESS = make_plan(
+    ("task1", "IN_PROGRESS", "None"),
+    ("task2", "IN_REVIEW", "None"),
+    ("task3", "ITERATING", "None"),
+)
+
+_PLAN_PARTIAL_DEPENDENCIES = make_plan(
+    ("dep1", "COMPLETED", "None"),
+    ("dep2", "PENDING", "None"),
+    ("task1", "PENDING", "dep1, dep2"),
+)
+
+_PLAN_EXISTING_TASK = make_plan(("existing-task", "PENDING", "None"))
+
+_PLAN_SIMPLE_PENDING = make_plan(("simple-task", "PENDING", "None"))
+
+_PLAN_DEP_PENDING = make_plan(
+    ("dep-task", "PENDING", "None"),
+    ("main-task", "PENDING", "dep-task"),
+)
+
+_PLAN_DEP_COMPLETED = make_plan(
+    ("dep-task", "COMPLETED", "None"),
+    ("main-task", "PENDING", "dep-task"),
+)
+
+_PLAN_DONE_TASK = make_plan(("done-task", "COMPLETED", "None"))
+
+_PLAN_ACTIVE_TASK = make_plan(("active-task", "IN_PROGRESS", "None"))
+
+_PLAN_UNKNOWN_DEPENDENCY = make_plan(("task1", "PENDING", "nonexistent-dep"))
+
+
+@lru_cache(maxsize=None)
+def _plan_fixture(plan_text: str) -> str:
+    """Return a workspace holding plan_text as plan.md, reused for identical plans.
+
+    The parser only reads the workspace, so tests with the same plan can share it.
+    """
+    workspace = tempfile.mkdtemp()
+    Path(workspace, "plan.md").write_text(plan_text)
+    _PLAN_WORKSPACES.append(workspace)
+    return workspace
+
+
+class TestParsePlan(unittest.TestCase):
+    """Tests for parse_plan function."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse every plan used by this class once; tests only read the results."""
+        cls.parsed = {
+            plan: plan_parser.parse_plan(_plan_fixture(plan))
+            for plan in (
+                _PLAN_SIMPLE_TASK,
+                _PLAN_WITH_DEPENDENCIES,
+                _PLAN_MIXED_CASE_STATUS,
+                _PLAN_PRIORITY_AND_DESCRIPTION,
+                _PLAN_NO_NUMBER_PREFIX,
+                _PLAN_BACKTICK_NAME,
+                _PLAN_NONE_DEPENDENCIES,
+            )
+        }
+
+    def test_parse_plan_no_file(self):
+        """Test parsing when plan.md doesn't exist."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = plan_parser.parse_plan(temp_dir)
+
+        self.assertFalse(result["success"])
+        self.assertIn("not found", result["error"])
+        self.assertEqual(result["tasks"], {})
+
+    def test_parse_plan_simple_task(self):
+        """Test parsing a simple task with status and dependencies."""
+        result = self.parsed[_PLAN_SIMPLE_TASK]
+
+        self.assertEqual(
+            (result["success"], result["task_count"], list(result["tasks"])),
+            (True, 1, ["setup-database"])
+        )
+
+        task = result["tasks"]["setup-database"]
+        self.assertEqual(
+            {k: task[k] for k in ("status", "dependencies", "branch")},
+            {
+                "status": "COMPLETED",
+                "dependencies": [],
+                "branch": "feature/K-123/setup-database",
+            }
+        )
+
+    def test_parse_plan_with_dependencies(self):
+        """Test parsing task with multiple dependencies."""
+        result = self.parsed[_PLAN_WITH_DEPENDENCIES]
 
         self.assertTrue(result["success"])
         self.assertEqual(result["task_count"], 3)
@@ -100,42 +232,17 @@ class TestParsePlan(unittest.TestCase):
 
     def test_parse_plan_case_insensitive_status(self):
         """Test that status is case-insensitive."""
-        plan_content = """# Plan
-
-### 1. task-lower
-- Status: completed
-
-### 2. task-upper
-- Status: COMPLETED
-
-### 3. task-mixed
-- Status: Completed
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = parse_plan(self.temp_dir)
+        result = self.parsed[_PLAN_MIXED_CASE_STATUS]
 
         self.assertTrue(result["success"])
         # All should be normalized to COMPLETED
-        self.assertEqual(result["tasks"]["task-lower"]["status"], "COMPLETED")
-        self.assertEqual(result["tasks"]["task-upper"]["status"], "COMPLETED")
-        self.assertEqual(result["tasks"]["task-mixed"]["status"], "COMPLETED")
+        for name in ("task-lower", "task-upper", "task-mixed"):
+            with self.subTest(task=name):
+                self.assertEqual(result["tasks"][name]["status"], "COMPLETED")
 
     def test_parse_plan_with_priority_and_description(self):
         """Test parsing optional fields like priority and description."""
-        plan_content = """# Plan
-
-### 1. critical-task
-- Status: PENDING
-- Dependencies: None
-- Priority: HIGH
-- Description: This is a critical task
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = parse_plan(self.temp_dir)
+        result = self.parsed[_PLAN_PRIORITY_AND_DESCRIPTION]
 
         self.assertTrue(result["success"])
         task = result["tasks"]["critical-task"]
@@ -144,91 +251,34 @@ class TestParsePlan(unittest.TestCase):
 
     def test_parse_plan_no_number_prefix(self):
         """Test parsing task without number prefix."""
-        plan_content = """# Plan
-
-### task-without-number
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = parse_plan(self.temp_dir)
+        result = self.parsed[_PLAN_NO_NUMBER_PREFIX]
 
         self.assertTrue(result["success"])
         self.assertIn("task-without-number", result["tasks"])
 
     def test_parse_plan_backtick_task_name(self):
         """Test parsing task name with backticks."""
-        plan_content = """# Plan
-
-### 1. `task-with-backticks`
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = parse_plan(self.temp_dir)
+        result = self.parsed[_PLAN_BACKTICK_NAME]
 
         self.assertTrue(result["success"])
         self.assertIn("task-with-backticks", result["tasks"])
 
     def test_parse_plan_none_dependencies(self):
         """Test various formats for no dependencies."""
-        plan_content = """# Plan
-
-### 1. task-none
-- Status: PENDING
-- Dependencies: None
-
-### 2. task-na
-- Status: PENDING
-- Dependencies: n/a
-
-### 3. task-dash
-- Status: PENDING
-- Dependencies: -
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = parse_plan(self.temp_dir)
+        result = self.parsed[_PLAN_NONE_DEPENDENCIES]
 
         self.assertTrue(result["success"])
-        self.assertEqual(result["tasks"]["task-none"]["dependencies"], [])
-        self.assertEqual(result["tasks"]["task-na"]["dependencies"], [])
-        self.assertEqual(result["tasks"]["task-dash"]["dependencies"], [])
+        for name in ("task-none", "task-na", "task-dash"):
+            with self.subTest(task=name):
+                self.assertEqual(result["tasks"][name]["dependencies"], [])
 
 
 class TestGetUnblockedTasks(unittest.TestCase):
     """Tests for get_unblocked_tasks function."""
 
-    def setUp(self):
-        """Create a temporary workspace for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up temporary workspace."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-
     def test_unblocked_no_dependencies(self):
         """Test that tasks with no dependencies are unblocked."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: PENDING
-- Dependencies: None
-
-### 2. task2
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = get_unblocked_tasks(self.temp_dir)
+        result = plan_parser.get_unblocked_tasks(_plan_fixture(_PLAN_TWO_INDEPENDENT))
 
         self.assertTrue(result["success"])
         self.assertIn("task1", result["unblocked"])
@@ -237,20 +287,7 @@ class TestGetUnblockedTasks(unittest.TestCase):
 
     def test_blocked_dependencies_not_met(self):
         """Test that tasks with unmet dependencies are blocked."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: PENDING
-- Dependencies: None
-
-### 2. task2
-- Status: PENDING
-- Dependencies: task1
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = get_unblocked_tasks(self.temp_dir)
+        result = plan_parser.get_unblocked_tasks(_plan_fixture(_PLAN_PENDING_CHAIN))
 
         self.assertTrue(result["success"])
         self.assertIn("task1", result["unblocked"])
@@ -259,20 +296,7 @@ class TestGetUnblockedTasks(unittest.TestCase):
 
     def test_unblocked_after_dependency_completed(self):
         """Test that tasks become unblocked when dependencies complete."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: COMPLETED
-- Dependencies: None
-
-### 2. task2
-- Status: PENDING
-- Dependencies: task1
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = get_unblocked_tasks(self.temp_dir)
+        result = plan_parser.get_unblocked_tasks(_plan_fixture(_PLAN_COMPLETED_CHAIN))
 
         self.assertTrue(result["success"])
         self.assertIn("task2", result["unblocked"])
@@ -281,51 +305,17 @@ class TestGetUnblockedTasks(unittest.TestCase):
 
     def test_in_progress_categorization(self):
         """Test that in-progress tasks are categorized correctly."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: IN_PROGRESS
-- Dependencies: None
-
-### 2. task2
-- Status: IN_REVIEW
-- Dependencies: None
-
-### 3. task3
-- Status: ITERATING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = get_unblocked_tasks(self.temp_dir)
+        result = plan_parser.get_unblocked_tasks(_plan_fixture(_PLAN_ALL_IN_PROGRESS))
 
         self.assertTrue(result["success"])
-        self.assertIn("task1", result["in_progress"])
-        self.assertIn("task2", result["in_progress"])
-        self.assertIn("task3", result["in_progress"])
+        for name in ("task1", "task2", "task3"):
+            with self.subTest(task=name):
+                self.assertIn(name, result["in_progress"])
         self.assertEqual(result["unblocked"], [])
 
     def test_multiple_dependencies_partial_met(self):
         """Test task with some dependencies met."""
-        plan_content = """# Plan
-
-### 1. dep1
-- Status: COMPLETED
-- Dependencies: None
-
-### 2. dep2
-- Status: PENDING
-- Dependencies: None
-
-### 3. task1
-- Status: PENDING
-- Dependencies: dep1, dep2
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = get_unblocked_tasks(self.temp_dir)
+        result = plan_parser.get_unblocked_tasks(_plan_fixture(_PLAN_PARTIAL_DEPENDENCIES))
 
         self.assertTrue(result["success"])
         self.assertIn("task1", result["blocked"])
@@ -335,27 +325,11 @@ class TestGetUnblockedTasks(unittest.TestCase):
 class TestCheckDependencies(unittest.TestCase):
     """Tests for check_dependencies function."""
 
-    def setUp(self):
-        """Create a temporary workspace for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up temporary workspace."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-
     def test_check_task_not_in_plan(self):
         """Test checking a task that doesn't exist in plan."""
-        plan_content = """# Plan
-
-### 1. existing-task
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = check_dependencies("nonexistent-task", self.temp_dir)
+        result = plan_parser.check_dependencies(
+            "nonexistent-task", _plan_fixture(_PLAN_EXISTING_TASK)
+        )
 
         self.assertTrue(result["success"])
         self.assertTrue(result["can_spawn"])  # Allow ad-hoc tasks
@@ -364,16 +338,7 @@ class TestCheckDependencies(unittest.TestCase):
 
     def test_check_task_no_dependencies(self):
         """Test checking a task with no dependencies."""
-        plan_content = """# Plan
-
-### 1. simple-task
-- Status: PENDING
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = check_dependencies("simple-task", self.temp_dir)
+        result = plan_parser.check_dependencies("simple-task", _plan_fixture(_PLAN_SIMPLE_PENDING))
 
         self.assertTrue(result["success"])
         self.assertTrue(result["can_spawn"])
@@ -382,20 +347,7 @@ class TestCheckDependencies(unittest.TestCase):
 
     def test_check_task_dependencies_not_met(self):
         """Test checking a task with unmet dependencies."""
-        plan_content = """# Plan
-
-### 1. dep-task
-- Status: PENDING
-- Dependencies: None
-
-### 2. main-task
-- Status: PENDING
-- Dependencies: dep-task
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = check_dependencies("main-task", self.temp_dir)
+        result = plan_parser.check_dependencies("main-task", _plan_fixture(_PLAN_DEP_PENDING))
 
         self.assertTrue(result["success"])
         self.assertFalse(result["can_spawn"])
@@ -405,20 +357,7 @@ class TestCheckDependencies(unittest.TestCase):
 
     def test_check_task_dependencies_met(self):
         """Test checking a task with all dependencies met."""
-        plan_content = """# Plan
-
-### 1. dep-task
-- Status: COMPLETED
-- Dependencies: None
-
-### 2. main-task
-- Status: PENDING
-- Dependencies: dep-task
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = check_dependencies("main-task", self.temp_dir)
+        result = plan_parser.check_dependencies("main-task", _plan_fixture(_PLAN_DEP_COMPLETED))
 
         self.assertTrue(result["success"])
         self.assertTrue(result["can_spawn"])
@@ -427,16 +366,7 @@ class TestCheckDependencies(unittest.TestCase):
 
     def test_check_completed_task(self):
         """Test checking a task that is already completed."""
-        plan_content = """# Plan
-
-### 1. done-task
-- Status: COMPLETED
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = check_dependencies("done-task", self.temp_dir)
+        result = plan_parser.check_dependencies("done-task", _plan_fixture(_PLAN_DONE_TASK))
 
         self.assertTrue(result["success"])
         self.assertFalse(result["can_spawn"])  # Can't spawn completed task
@@ -444,16 +374,7 @@ class TestCheckDependencies(unittest.TestCase):
 
     def test_check_in_progress_task(self):
         """Test checking a task that is in progress."""
-        plan_content = """# Plan
-
-### 1. active-task
-- Status: IN_PROGRESS
-- Dependencies: None
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = check_dependencies("active-task", self.temp_dir)
+        result = plan_parser.check_dependencies("active-task", _plan_fixture(_PLAN_ACTIVE_TASK))
 
         self.assertTrue(result["success"])
         self.assertTrue(result["can_spawn"])  # Allow re-spawning
@@ -461,16 +382,7 @@ class TestCheckDependencies(unittest.TestCase):
 
     def test_check_missing_dependency_not_in_plan(self):
         """Test when a dependency doesn't exist in the plan."""
-        plan_content = """# Plan
-
-### 1. task1
-- Status: PENDING
-- Dependencies: nonexistent-dep
-"""
-        plan_path = Path(self.temp_dir) / "plan.md"
-        plan_path.write_text(plan_content)
-
-        result = check_dependencies("task1", self.temp_dir)
+        result = plan_parser.check_dependencies("task1", _plan_fixture(_PLAN_UNKNOWN_DEPENDENCY))
 
         self.assertTrue(result["success"])
         self.assertFalse(result["can_spawn"])
@@ -482,9 +394,9 @@ class TestCompletedStatuses(unittest.TestCase):
 
     def test_completed_statuses(self):
         """Test that expected statuses are considered complete."""
-        self.assertIn("COMPLETED", COMPLETED_STATUSES)
-        self.assertIn("DONE", COMPLETED_STATUSES)
-        self.assertIn("MERGED", COMPLETED_STATUSES)
+        self.assertIn("COMPLETED", plan_parser.COMPLETED_STATUSES)
+        self.assertIn("DONE", plan_parser.COMPLETED_STATUSES)
+        self.assertIn("MERGED", plan_parser.COMPLETED_STATUSES)
 
     def test_valid_statuses(self):
         """Test that all expected statuses are valid."""
@@ -492,7 +404,7 @@ class TestCompletedStatuses(unittest.TestCase):
             'PENDING', 'IN_PROGRESS', 'IN_REVIEW', 'ITERATING',
             'COMPLETED', 'DONE', 'MERGED', 'BLOCKED', 'ABANDONED'
         }
-        self.assertEqual(VALID_STATUSES, expected)
+        self.assertEqual(plan_parser.VALID_STATUSES, expected)
 
 
 if __name__ == "__main__":
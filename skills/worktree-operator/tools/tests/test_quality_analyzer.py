@@ -10,8 +10,10 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports, once per interpreter
+_TOOLS_DIR = str(Path(__file__).parent.parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.insert(0, _TOOLS_DIR)
 
 from quality_analyzer import (
     parse_acceptance_criteria,
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""Unit tests for validation.py."""
+
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports, once per interpreter
+_TOOLS_DIR = str(Path(__file__).parent.parent)
+if _TOOLS_DIR not in sys.path:
+    sys.path.insert(0, _TOOLS_DIR)
+
+from validation import (
+    ValidationError,
+    validate_task_name,
+    validate_ticket,
+    validate_tickets_bulk,
+    validate_branch_name,
+    validate_triple,
+    validate_model,
+    validate_path,
+    validate_url,
+    validate_positive_int,
+    validate_all,
+    safe_validate,
+    safe_validate_strict,
+)
+
+
+class TestValidateTaskName(unittest.TestCase):
+    """Tests for validate_task_name function."""
+
+    def test_valid_task_names(self):
+        """Test that well-formed task names are returned stripped."""
+        for name in ("fix-logging", "add_auth", "a", "Refactor2", "x" * 50):
+            with self.subTest(name=name):
+                self.assertEqual(validate_task_name(f"  {name} "), name)
+
+    def test_invalid_task_names(self):
+        """Test that malformed task names are rejected."""
+        for name in (None, "", "   ", "-leading", "has space", "bad!", "x" * 51):
+            with self.subTest(name=name):
+                with self.assertRaises(ValidationError):
+                    validate_task_name(name)
+
+
+class TestValidateTicket(unittest.TestCase):
+    """Tests for validate_ticket function."""
+
+    def test_valid_ticket_uppercased(self):
+        """Test that tickets are stripped and uppercased."""
+        self.assertEqual(validate_ticket(" k-123 "), "K-123")
+        self.assertEqual(validate_ticket("PROJ-456"), "PROJ-456")
+
+    def test_valid_ticket_interned(self):
+        """Test that equal tickets come back as the same object."""
+        self.assertIs(validate_ticket("k-77"), validate_ticket(" K-77"))
+
+    def test_invalid_tickets(self):
+        """Test that malformed ticket IDs are rejected."""
+        for ticket in (None, "", "WH", "K123", "K-", "-123", "ABCDEFGHIJK-1", "K-12345678901"):
+            with self.subTest(ticket=ticket):
+                with self.assertRaises(ValidationError):
+                    validate_ticket(ticket)
+
+    def test_validate_tickets_bulk(self):
+        """Test bulk validation normalizes tickets and keeps input order."""
+        self.assertEqual(
+            validate_tickets_bulk(["k-1", " PROJ-22 ", "AB-333"]),
+            ["K-1", "PROJ-22", "AB-333"]
+        )
+        self.assertEqual(validate_tickets_bulk(iter([])), [])
+
+    def test_validate_tickets_bulk_reports_bad_ticket(self):
+        """Test bulk validation raises the single-ticket error."""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_tickets_bulk(["K-1", "nope", None])
+        self.assertIn("'NOPE'", ctx.exception.message)
+
+
+class TestValidateBranchName(unittest.TestCase):
+    """Tests for validate_branch_name function."""
+
+    def test_valid_branch_names(self):
+        """Test that common branch names are accepted."""
+        for branch in ("main", "feature/K-123/fix-bug", "release-1.0", "a" * 200):
+            with self.subTest(branch=branch):
+                self.assertEqual(validate_branch_name(branch), branch)
+
+    def test_forbidden_characters(self):
+        """Test that the first forbidden character is reported."""
+        cases = {
+            "a~b": "~", "a^b": "^", "a:b": ":", "a?b": "?",
+            "a*b": "*", "a[b": "[", "a\\b": "\\", "a^b:c": "^",
+        }
+        for branch, char in cases.items():
+            with self.subTest(branch=branch):
+                with self.assertRaises(ValidationError) as ctx:
+                    validate_branch_name(branch)
+                self.assertIn(f"forbidden character: '{char}'", ctx.exception.message)
+
+    def test_forbidden_sequences(self):
+        """Test that forbidden sequences are reported."""
+        cases = (("a..b", ".."), ("a@{b", "@{"), ("a//b", "//"), ("a//b..c", "//"))
+        for branch, seq in cases:
+            with self.subTest(branch=branch):
+                with self.assertRaises(ValidationError) as ctx:
+                    validate_branch_name(branch)
+                self.assertIn(f"forbidden sequence: '{seq}'", ctx.exception.message)
+
+    def test_other_invalid_branch_names(self):
+        """Test pattern, .lock suffix, and trailing slash failures."""
+        cases = {
+            "-main": "start with alphanumeric",
+            "a" * 201: "start with alphanumeric",
+            "caf\u00e9": "start with alphanumeric",
+            "feature/\u00b2": "start with alphanumeric",
+            "main.lock": ".lock",
+            "feature/": "'/'",
+        }
+        for branch, message in cases.items():
+            with self.subTest(branch=branch):
+                with self.assertRaises(ValidationError) as ctx:
+                    validate_branch_name(branch)
+                self.assertIn(message, ctx.exception.message)
+
+    def test_over_length_rejected_first(self):
+        """Test that an over-length name is rejected before other checks."""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_branch_name("a~" * 101)
+        self.assertIn("1-200 characters", ctx.exception.message)
+        self.assertIn("200", ctx.exception.hint)
+
+    def test_repeat_calls_use_cache(self):
+        """Test that repeated valid names are served from the cache."""
+        validate_branch_name.cache_clear()
+        validate_branch_name("feature/cached")
+        validate_branch_name("feature/cached")
+
+        info = validate_branch_name.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_unhashable_input_raises_validation_error(self):
+        """Test that non-str input skips the cache and is still validated."""
+        with self.assertRaises(ValidationError):
+            validate_branch_name(["main"])
+
+    def test_empty_branch(self):
+        """Test that None and blank branch names are rejected."""
+        for branch in (None, "", "  "):
+            with self.subTest(branch=branch):
+                with self.assertRaises(ValidationError):
+                    validate_branch_name(branch)
+
+
+class TestValidateTriple(unittest.TestCase):
+    """Tests for validate_triple function."""
+
+    def test_matches_individual_validators(self):
+        """Test that results equal the individual validators for mixed inputs."""
+        cases = [
+            ("fix-bug", "K-123", "feature/K-123/fix-bug"),
+            (" fix-bug ", "k-123", " main "),
+            ("a" * 50, "ABCDEFGHIJ-1234567890", "b" * 200),
+        ]
+        for task_name, ticket, branch in cases:
+            with self.subTest(task_name=task_name, ticket=ticket, branch=branch):
+                self.assertEqual(
+                    validate_triple(task_name, ticket, branch),
+                    (validate_task_name(task_name), validate_ticket(ticket),
+                     validate_branch_name(branch))
+                )
+
+    def test_invalid_field_raises(self):
+        """Test that an invalid field raises its own error."""
+        cases = [
+            ("bad name", "K-1", "main", "task name"),
+            ("ok", "K1", "main", "ticket ID"),
+            ("ok", "K-1", "main.lock", "branch name"),
+            ("ok", "K-1", "a..b", "branch name"),
+            ("ok", "K-1", "feature/", "branch name"),
+        ]
+        for task_name, ticket, branch, message in cases:
+            with self.subTest(task_name=task_name, ticket=ticket, branch=branch):
+                with self.assertRaises(ValidationError) as ctx:
+                    validate_triple(task_name, ticket, branch)
+                self.assertIn(f"Invalid {message}", ctx.exception.message)
+
+
+class TestValidateModel(unittest.TestCase):
+    """Tests for validate_model function."""
+
+    def test_valid_models(self):
+        """Test that models are normalized to lowercase."""
+        for model, expected in (("opus", "opus"), ("Sonnet", "sonnet"), (" HAIKU ", "haiku")):
+            with self.subTest(model=model):
+                self.assertEqual(validate_model(model), expected)
+
+    def test_model_returns_canonical_object(self):
+        """Test that any spelling returns the same canonical string object."""
+        self.assertIs(validate_model(" oPuS "), validate_model("opus"))
+
+    def test_invalid_models(self):
+        """Test that unknown models are rejected."""
+        for model in (None, "", "gpt"):
+            with self.subTest(model=model):
+                with self.assertRaises(ValidationError):
+                    validate_model(model)
+
+
+class TestValidatePath(unittest.TestCase):
+    """Tests for validate_path function."""
+
+    def test_resolves_path(self):
+        """Test that a path resolves to an absolute Path."""
+        result = validate_path("some/./dir/")
+        self.assertTrue(result.is_absolute())
+        self.assertEqual(result, Path(os.getcwd(), "some", "dir"))
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "needs os.symlink")
+    def test_symlinks_followed_only_with_checks(self):
+        """Test that symlinks are resolved only when existence is checked."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir).resolve() / "target"
+            target.mkdir()
+            link = Path(temp_dir).resolve() / "link"
+            os.symlink(target, link)
+
+            self.assertEqual(validate_path(str(link)), link)
+            self.assertEqual(validate_path(str(link), must_exist=True), target)
+
+    @unittest.skipIf(os.name == "nt", "a leading '//' is a UNC prefix on Windows")
+    def test_leading_double_slash_matches_resolve(self):
+        """Test that a leading '//' is collapsed with and without checks."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = "/" + str(Path(temp_dir).resolve())
+
+            self.assertEqual(validate_path(path), Path(temp_dir).resolve())
+            self.assertEqual(validate_path(path), validate_path(path, must_exist=True))
+
+    def test_rejects_over_length_path(self):
+        """Test that paths longer than MAX_PATH_LENGTH are rejected."""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_path("a" * 4097)
+        self.assertIn("too long", ctx.exception.message)
+
+    def test_rejects_traversal_and_empty(self):
+        """Test that '..' and empty paths are rejected."""
+        for path in (None, "", "a/../b"):
+            with self.subTest(path=path):
+                with self.assertRaises(ValidationError):
+                    validate_path(path)
+
+    def test_must_exist_and_must_be_dir(self):
+        """Test the existence and directory checks."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "file.txt")
+            Path(file_path).write_text("x")
+
+            self.assertEqual(validate_path(temp_dir, must_exist=True, must_be_dir=True),
+                             Path(temp_dir).resolve())
+            with self.assertRaises(ValidationError):
+                validate_path(os.path.join(temp_dir, "missing"), must_exist=True)
+            with self.assertRaises(ValidationError):
+                validate_path(file_path, must_be_dir=True)
+
+
+class TestValidateUrl(unittest.TestCase):
+    """Tests for validate_url function."""
+
+    def test_valid_urls(self):
+        """Test that URLs with allowed schemes are accepted."""
+        for url in ("https://github.com/user/repo.git", "ssh://git@host/repo", "repo/path"):
+            with self.subTest(url=url):
+                self.assertEqual(validate_url(url), url)
+
+    def test_invalid_urls(self):
+        """Test that bad schemes and empty URLs are rejected."""
+        for url in (None, "", "ftp://host/file"):
+            with self.subTest(url=url):
+                with self.assertRaises(ValidationError):
+                    validate_url(url)
+
+    def test_custom_schemes(self):
+        """Test that allowed_schemes restricts the accepted schemes."""
+        self.assertEqual(validate_url("ftp://host/f", allowed_schemes=["ftp"]), "ftp://host/f")
+        self.assertEqual(validate_url("ftp://host/f", allowed_schemes=("ftp",)), "ftp://host/f")
+        with self.assertRaises(ValidationError) as ctx:
+            validate_url("https://host/f", allowed_schemes=["sftp", "ftp"])
+        self.assertIn("Allowed: ftp, sftp", ctx.exception.message)
+
+    def test_default_schemes_listed_in_error(self):
+        """Test that the default schemes are listed when a scheme is rejected."""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_url("ftp://host/file")
+        self.assertIn("Allowed: http, https, git, ssh", ctx.exception.message)
+
+
+class TestValidatePositiveInt(unittest.TestCase):
+    """Tests for validate_positive_int function."""
+
+    def test_valid_values(self):
+        """Test that positive ints and numeric strings are accepted."""
+        self.assertEqual(validate_positive_int(3), 3)
+        self.assertEqual(validate_positive_int("7"), 7)
+
+    def test_invalid_values(self):
+        """Test that non-positive and non-numeric values are rejected."""
+        for value in (None, 0, -1, "abc"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    validate_positive_int(value, name="count")
+
+
+class TestValidationError(unittest.TestCase):
+    """Tests for ValidationError class."""
+
+    def test_to_dict(self):
+        """Test the error dict with and without a hint."""
+        self.assertEqual(
+            ValidationError("bad", hint="fix it").to_dict(),
+            {"success": False, "error": "bad", "validation_error": True, "hint": "fix it"}
+        )
+        self.assertNotIn("hint", ValidationError("bad").to_dict())
+
+    def test_pickle_round_trip(self):
+        """Test that message and hint survive pickling."""
+        error = pickle.loads(pickle.dumps(ValidationError("bad", hint="fix it")))
+        self.assertEqual((error.message, error.hint, str(error)), ("bad", "fix it", "bad"))
+
+
+class TestValidateAll(unittest.TestCase):
+    """Tests for validate_all and safe_validate."""
+
+    def test_validate_all_success(self):
+        """Test that all validated values are returned."""
+        result = validate_all(
+            task_name=("fix-bug", validate_task_name),
+            ticket=("k-1", validate_ticket),
+        )
+        self.assertEqual(result, {"task_name": "fix-bug", "ticket": "K-1"})
+
+    def test_validate_all_collects_errors(self):
+        """Test that every failure is listed in one error."""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_all(
+                task_name=("bad name", validate_task_name),
+                ticket=("nope", validate_ticket),
+                model=("opus", validate_model),
+            )
+        message = ctx.exception.message
+        self.assertIn("task_name:", message)
+        self.assertIn("ticket:", message)
+        self.assertNotIn("model:", message)
+
+    def test_safe_validate(self):
+        """Test that safe_validate returns (success, value or error dict)."""
+        self.assertEqual(safe_validate(validate_model, "opus"), (True, "opus"))
+
+        ok, error = safe_validate(validate_model, "gpt")
+        self.assertFalse(ok)
+        self.assertFalse(error["success"])
+        self.assertTrue(error["validation_error"])
+        self.assertIn("hint", error)
+
+        ok, error = safe_validate(lambda v: 1 / 0, "x", default_error="Boom")
+        self.assertFalse(ok)
+        self.assertTrue(error["error"].startswith("Boom: "))
+
+    def test_safe_validate_strict(self):
+        """Test that safe_validate_strict only converts ValidationError."""
+        self.assertEqual(safe_validate_strict(validate_model, "opus"), (True, "opus"))
+        self.assertEqual(
+            safe_validate_strict(validate_model, "gpt"),
+            safe_validate(validate_model, "gpt")
+        )
+        with self.assertRaises(ZeroDivisionError):
+            safe_validate_strict(lambda v: 1 / 0, "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
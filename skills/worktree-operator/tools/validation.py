@@ -3,30 +3,98 @@
 
 import os
 import re
+import string
+import sys
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 
-# Validation patterns
-TASK_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_-]{0,49}$')
-TICKET_PATTERN = re.compile(r'^[A-Z]{1,10}-[0-9]{1,10}$')
-BRANCH_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9/_.-]{0,199}$')
+# Validation patterns (unanchored; use fullmatch)
+TASK_NAME_PATTERN = re.compile(r'[a-zA-Z0-9][a-zA-Z0-9_-]{0,49}')
+TICKET_PATTERN = re.compile(r'[A-Z]{1,10}-[0-9]{1,10}')
+BRANCH_NAME_PATTERN = re.compile(r'[a-zA-Z0-9][a-zA-Z0-9/_.-]{0,199}')
 MODEL_CHOICES = {'opus', 'sonnet', 'haiku'}
 
+# Longest inputs the patterns above can accept; longer input is rejected without a regex
+MAX_TASK_NAME_LENGTH = 50
+MAX_TICKET_LENGTH = 21
+MAX_BRANCH_NAME_LENGTH = 200
+MAX_PATH_LENGTH = 4096
+
+# Common spellings of each model mapped straight to the canonical name
+_MODEL_MAP = {
+    variant: model
+    for model in MODEL_CHOICES
+    for variant in (model, model.upper(), model.capitalize())
+}
+
+# Same rules as TASK_NAME_PATTERN, checked with set operations instead of the regex engine
+_ALNUM_CHARS = frozenset(string.ascii_letters + string.digits)
+_TASK_NAME_CHARS = _ALNUM_CHARS | frozenset('_-')
+# Bytes BRANCH_NAME_PATTERN allows; deleting them with bytes.translate leaves only bad ones
+_BRANCH_NAME_BYTES = (string.ascii_letters + string.digits + '/_.-').encode('ascii')
+
 # Characters that are forbidden in git branch names
 GIT_FORBIDDEN_CHARS = set('~^:?*[\\')
 GIT_FORBIDDEN_SEQUENCES = ['..', '@{', '//']
 
+# Static parts of error messages and hints; only the offending value is formatted in
+_TASK_NAME_HINT = "Provide a task name like 'fix-logging' or 'add-auth'"
+_TASK_NAME_INVALID_MSG = (
+    "Invalid task name: '{}'. "
+    "Must be 1-50 characters, start with alphanumeric, "
+    "and contain only letters, numbers, hyphens, and underscores."
+)
+_TASK_NAME_INVALID_HINT = "Examples: 'fix-logging', 'add_auth', 'refactor-api-v2'"
+_TICKET_HINT = "Provide a ticket ID like 'K-123' or 'PROJ-456'"
+_TICKET_INVALID_MSG = (
+    "Invalid ticket ID: '{}'. "
+    "Must be in format: PREFIX-NUMBER (e.g., K-123, PROJ-456)"
+)
+_TICKET_INVALID_HINT = "Use uppercase letters for prefix, numbers for ID"
+_BRANCH_HINT = "Provide a branch name like 'main' or 'feature/K-123/fix-bug'"
+_MODEL_CHOICES_STR = ', '.join(sorted(MODEL_CHOICES))
+_MODEL_INVALID_MSG = "Invalid model: '{}'. Must be one of: " + _MODEL_CHOICES_STR
+_MODEL_INVALID_HINT = "Use 'opus' for best quality, 'sonnet' for balanced, 'haiku' for fast"
+_PATH_HINT = "Provide a valid filesystem path"
+_URL_HINT = "Provide a valid URL"
+
+# URL schemes accepted by validate_url unless the caller passes its own
+_DEFAULT_URL_SCHEMES = frozenset({'http', 'https', 'git', 'ssh'})
+_DEFAULT_URL_SCHEMES_STR = 'http, https, git, ssh'
+_FORBIDDEN_CHAR_RE = re.compile('[' + re.escape(''.join(sorted(GIT_FORBIDDEN_CHARS))) + ']')
+_FORBIDDEN_SEQ_RE = re.compile('|'.join(map(re.escape, GIT_FORBIDDEN_SEQUENCES)))
+
+# All branch name rules in one pass; the individual checks only run to explain a failure
+_BRANCH_FULL_RE = re.compile(
+    r'(?!.*(?:\.\.|@\{|//))(?!.*\.lock\Z)(?!.*/\Z)' + BRANCH_NAME_PATTERN.pattern,
+    re.DOTALL
+)
+
+# Task name, ticket and branch joined by NULs, none of which may contain one;
+# the branch goes last so its lookaheads only see the branch
+_TRIPLE_RE = re.compile(
+    TASK_NAME_PATTERN.pattern + '\x00' + TICKET_PATTERN.pattern + '\x00' + _BRANCH_FULL_RE.pattern,
+    re.DOTALL
+)
+
 
 class ValidationError(Exception):
     """Raised when input validation fails."""
 
+    __slots__ = ('message', 'hint')
+
     def __init__(self, message: str, hint: Optional[str] = None):
         super().__init__(message)
         self.message = message
         self.hint = hint
 
+    def __reduce__(self):
+        # Slots are not in __dict__, so pass hint explicitly to survive pickling
+        return self.__class__, (self.message, self.hint)
+
     def to_dict(self) -> dict:
         """Convert to error dict format used by tools."""
         result = {
@@ -39,6 +107,28 @@ class ValidationError(Exception):
         return result
 
 
+def _memoize(validator):
+    """
+    Cache results of a pure single-argument validator for str input.
+
+    Only successful results are cached; invalid input raises every time.
+    Non-str input bypasses the cache, so unhashable values still get a
+    ValidationError instead of a TypeError.
+    """
+    cached = lru_cache(maxsize=2048)(validator)
+
+    @wraps(validator)
+    def wrapper(value):
+        if type(value) is str:
+            return cached(value)
+        return validator(value)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_memoize
 def validate_task_name(task_name: str) -> str:
     """
     Validate task name format.
@@ -61,28 +151,35 @@ def validate_task_name(task_name: str) -> str:
     if task_name is None:
         raise ValidationError(
             "Task name cannot be None",
-            hint="Provide a task name like 'fix-logging' or 'add-auth'"
+            hint=_TASK_NAME_HINT
         )
 
-    task_name = str(task_name).strip()
+    task_name = (task_name if isinstance(task_name, str) else str(task_name)).strip()
 
     if not task_name:
         raise ValidationError(
             "Task name cannot be empty",
-            hint="Provide a task name like 'fix-logging' or 'add-auth'"
+            hint=_TASK_NAME_HINT
         )
 
-    if not TASK_NAME_PATTERN.match(task_name):
+    if len(task_name) > MAX_TASK_NAME_LENGTH:
         raise ValidationError(
-            f"Invalid task name: '{task_name}'. "
-            "Must be 1-50 characters, start with alphanumeric, "
-            "and contain only letters, numbers, hyphens, and underscores.",
-            hint="Examples: 'fix-logging', 'add_auth', 'refactor-api-v2'"
+            _TASK_NAME_INVALID_MSG.format(task_name),
+            hint=_TASK_NAME_INVALID_HINT
+        )
+
+    # With the length checked above, these set checks accept exactly what
+    # TASK_NAME_PATTERN does
+    if task_name[0] not in _ALNUM_CHARS or not _TASK_NAME_CHARS.issuperset(task_name):
+        raise ValidationError(
+            _TASK_NAME_INVALID_MSG.format(task_name),
+            hint=_TASK_NAME_INVALID_HINT
         )
 
     return task_name
 
 
+@_memoize
 def validate_ticket(ticket: str) -> str:
     """
     Validate ticket ID format.
@@ -96,7 +193,7 @@ def validate_ticket(ticket: str) -> str:
         ticket: Ticket ID to validate (e.g., "K-123", "PROJ-456")
 
     Returns:
-        Validated ticket ID (uppercase)
+        Validated ticket ID (uppercase, interned)
 
     Raises:
         ValidationError: If ticket ID is invalid
@@ -104,27 +201,57 @@ def validate_ticket(ticket: str) -> str:
     if ticket is None:
         raise ValidationError(
             "Ticket ID cannot be None",
-            hint="Provide a ticket ID like 'K-123' or 'PROJ-456'"
+            hint=_TICKET_HINT
         )
 
-    ticket = str(ticket).strip().upper()
+    ticket = (ticket if isinstance(ticket, str) else str(ticket)).strip().upper()
 
     if not ticket:
         raise ValidationError(
             "Ticket ID cannot be empty",
-            hint="Provide a ticket ID like 'K-123' or 'PROJ-456'"
+            hint=_TICKET_HINT
         )
 
-    if not TICKET_PATTERN.match(ticket):
+    if len(ticket) > MAX_TICKET_LENGTH or not TICKET_PATTERN.fullmatch(ticket):
         raise ValidationError(
-            f"Invalid ticket ID: '{ticket}'. "
-            "Must be in format: PREFIX-NUMBER (e.g., K-123, PROJ-456)",
-            hint="Use uppercase letters for prefix, numbers for ID"
+            _TICKET_INVALID_MSG.format(ticket),
+            hint=_TICKET_INVALID_HINT
         )
 
-    return ticket
+    # Tickets end up as dict keys and in comparisons; interning makes those pointer checks
+    return sys.intern(ticket)
+
+
+def validate_tickets_bulk(tickets: Iterable[str]) -> List[str]:
+    """
+    Validate many ticket IDs in one call.
+
+    Well-formed tickets are checked inline against TICKET_PATTERN; anything
+    else goes through validate_ticket so the error matches a single call.
+
+    Args:
+        tickets: Ticket IDs to validate
 
+    Returns:
+        Validated ticket IDs (uppercase), in input order
 
+    Raises:
+        ValidationError: On the first invalid ticket ID
+    """
+    match = TICKET_PATTERN.fullmatch
+    validated = []
+    append = validated.append
+    for ticket in tickets:
+        if type(ticket) is str:
+            normalized = ticket.strip().upper()
+            if match(normalized):
+                append(sys.intern(normalized))
+                continue
+        append(validate_ticket(ticket))
+    return validated
+
+
+@_memoize
 def validate_branch_name(branch: str) -> str:
     """
     Validate git branch name.
@@ -147,37 +274,48 @@ def validate_branch_name(branch: str) -> str:
     if branch is None:
         raise ValidationError(
             "Branch name cannot be None",
-            hint="Provide a branch name like 'main' or 'feature/K-123/fix-bug'"
+            hint=_BRANCH_HINT
         )
 
-    branch = str(branch).strip()
+    branch = (branch if isinstance(branch, str) else str(branch)).strip()
 
     if not branch:
         raise ValidationError(
             "Branch name cannot be empty",
-            hint="Provide a branch name like 'main' or 'feature/K-123/fix-bug'"
-        )
-
-    # Check for forbidden characters
-    for char in GIT_FORBIDDEN_CHARS:
-        if char in branch:
-            raise ValidationError(
-                f"Invalid branch name: '{branch}'. "
-                f"Contains forbidden character: '{char}'",
-                hint="Git branch names cannot contain: ~ ^ : ? * [ \\"
-            )
-
-    # Check for forbidden sequences
-    for seq in GIT_FORBIDDEN_SEQUENCES:
-        if seq in branch:
-            raise ValidationError(
-                f"Invalid branch name: '{branch}'. "
-                f"Contains forbidden sequence: '{seq}'",
-                hint="Git branch names cannot contain: .. @{ //"
-            )
-
-    # Check pattern
-    if not BRANCH_NAME_PATTERN.match(branch):
+            hint=_BRANCH_HINT
+        )
+
+    if len(branch) > MAX_BRANCH_NAME_LENGTH:
+        raise ValidationError(
+            f"Invalid branch name: '{branch}'. "
+            "Must be 1-200 characters, start with alphanumeric.",
+            hint="Shorten the branch name to at most 200 characters"
+        )
+
+    if _BRANCH_FULL_RE.fullmatch(branch):
+        return branch
+
+    # Check for forbidden characters (one scan, reports the first one found)
+    forbidden = _FORBIDDEN_CHAR_RE.search(branch)
+    if forbidden:
+        raise ValidationError(
+            f"Invalid branch name: '{branch}'. "
+            f"Contains forbidden character: '{forbidden.group(0)}'",
+            hint="Git branch names cannot contain: ~ ^ : ? * [ \\"
+        )
+
+    # Check for forbidden sequences (one scan, reports the first one found)
+    forbidden = _FORBIDDEN_SEQ_RE.search(branch)
+    if forbidden:
+        raise ValidationError(
+            f"Invalid branch name: '{branch}'. "
+            f"Contains forbidden sequence: '{forbidden.group(0)}'",
+            hint="Git branch names cannot contain: .. @{ //"
+        )
+
+    # Check allowed characters in one C-level pass (length was checked above)
+    if not (branch.isascii() and branch[0] in _ALNUM_CHARS
+            and not branch.encode('ascii').translate(None, _BRANCH_NAME_BYTES)):
         raise ValidationError(
             f"Invalid branch name: '{branch}'. "
             "Must be 1-200 characters, start with alphanumeric.",
@@ -203,6 +341,31 @@ def validate_branch_name(branch: str) -> str:
     return branch
 
 
+def validate_triple(task_name: str, ticket: str, branch: str) -> Tuple[str, str, str]:
+    """
+    Validate a task name, ticket ID and branch name together.
+
+    Already-normalized input is accepted with a single regex match; anything
+    else falls back to the individual validators for normalization and errors.
+
+    Args:
+        task_name: Task name to validate
+        ticket: Ticket ID to validate
+        branch: Branch name to validate
+
+    Returns:
+        Tuple of (task_name, ticket, branch) as the individual validators return them
+
+    Raises:
+        ValidationError: If any of the three is invalid
+    """
+    if type(task_name) is str and type(ticket) is str and type(branch) is str:
+        if _TRIPLE_RE.fullmatch(f"{task_name}\x00{ticket}\x00{branch}"):
+            return task_name, sys.intern(ticket), branch
+    return validate_task_name(task_name), validate_ticket(ticket), validate_branch_name(branch)
+
+
+@_memoize
 def validate_model(model: str) -> str:
     """
     Validate model choice.
@@ -219,18 +382,24 @@ def validate_model(model: str) -> str:
     if model is None:
         raise ValidationError(
             "Model cannot be None",
-            hint=f"Choose one of: {', '.join(MODEL_CHOICES)}"
+            hint="Choose one of: " + _MODEL_CHOICES_STR
         )
 
-    model = str(model).strip().lower()
+    if isinstance(model, str):
+        canonical = _MODEL_MAP.get(model)
+        if canonical is not None:
+            return canonical
+
+    model = (model if isinstance(model, str) else str(model)).strip().lower()
 
     if model not in MODEL_CHOICES:
         raise ValidationError(
-            f"Invalid model: '{model}'. Must be one of: {', '.join(sorted(MODEL_CHOICES))}",
-            hint="Use 'opus' for best quality, 'sonnet' for balanced, 'haiku' for fast"
+            _MODEL_INVALID_MSG.format(model),
+            hint=_MODEL_INVALID_HINT
         )
 
-    return model
+    # Return the canonical (interned) constant rather than the lowercased copy
+    return _MODEL_MAP[model]
 
 
 def validate_path(path: str, must_exist: bool = False, must_be_dir: bool = False) -> Path:
@@ -240,7 +409,9 @@ def validate_path(path: str, must_exist: bool = False, must_be_dir: bool = False
     Rules:
     - Cannot be empty
     - Cannot contain path traversal (..)
-    - Resolves to absolute path
+    - Resolves to absolute path (symlinks are only followed when
+      must_exist or must_be_dir is set; otherwise it is a lexical
+      abspath/normpath with no filesystem access)
 
     Args:
         path: Path to validate
@@ -256,15 +427,21 @@ def validate_path(path: str, must_exist: bool = False, must_be_dir: bool = False
     if path is None:
         raise ValidationError(
             "Path cannot be None",
-            hint="Provide a valid filesystem path"
+            hint=_PATH_HINT
         )
 
-    path_str = str(path).strip()
+    path_str = (path if isinstance(path, str) else str(path)).strip()
 
     if not path_str:
         raise ValidationError(
             "Path cannot be empty",
-            hint="Provide a valid filesystem path"
+            hint=_PATH_HINT
+        )
+
+    if len(path_str) > MAX_PATH_LENGTH:
+        raise ValidationError(
+            f"Path is too long ({len(path_str)} characters, max {MAX_PATH_LENGTH})",
+            hint="Use a shorter path"
         )
 
     # Check for path traversal attempts in the input
@@ -274,6 +451,14 @@ def validate_path(path: str, must_exist: bool = False, must_be_dir: bool = False
             hint="Use absolute paths without '..' components"
         )
 
+    # Without filesystem checks callers only need an absolute, normalized path
+    if not must_exist and not must_be_dir:
+        normalized = os.path.normpath(os.path.abspath(path_str))
+        # POSIX normpath keeps a leading '//', which resolve() collapses
+        if normalized.startswith('//'):
+            normalized = normalized[1:]
+        return Path(normalized)
+
     # Resolve to absolute path
     try:
         resolved = Path(path_str).resolve()
@@ -308,13 +493,32 @@ def validate_path(path: str, must_exist: bool = False, must_be_dir: bool = False
     return resolved
 
 
-def validate_url(url: str, allowed_schemes: Optional[list] = None) -> str:
+def _cheap_url_parse(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Split 'scheme://rest' without urlparse.
+
+    Returns (lowercased scheme, rest), or None when the URL is not in that
+    simple form and needs the full urlparse treatment.
+    """
+    i = url.find('://')
+    if i <= 0:
+        return None
+    rest = url[i + 3:]
+    # Empty host, query/fragment-only, IPv6 literals and control characters
+    # are left to urlparse so its edge-case handling stays authoritative
+    if (not rest or rest[0] in '?#' or '[' in rest or ']' in rest
+            or not rest.isprintable()):
+        return None
+    return url[:i].lower(), rest
+
+
+def validate_url(url: str, allowed_schemes: Optional[Iterable[str]] = None) -> str:
     """
     Validate a URL.
 
     Args:
         url: URL to validate
-        allowed_schemes: List of allowed schemes (default: ['http', 'https', 'git', 'ssh'])
+        allowed_schemes: Allowed schemes (default: http, https, git, ssh)
 
     Returns:
         Validated URL
@@ -323,22 +527,29 @@ def validate_url(url: str, allowed_schemes: Optional[list] = None) -> str:
         ValidationError: If URL is invalid
     """
     if allowed_schemes is None:
-        allowed_schemes = ['http', 'https', 'git', 'ssh']
+        schemes = _DEFAULT_URL_SCHEMES
+    else:
+        schemes = frozenset(allowed_schemes)
 
     if url is None:
         raise ValidationError(
             "URL cannot be None",
-            hint="Provide a valid URL"
+            hint=_URL_HINT
         )
 
-    url = str(url).strip()
+    url = (url if isinstance(url, str) else str(url)).strip()
 
     if not url:
         raise ValidationError(
             "URL cannot be empty",
-            hint="Provide a valid URL"
+            hint=_URL_HINT
         )
 
+    # Common 'scheme://host/...' form with an allowed scheme
+    cheap = _cheap_url_parse(url)
+    if cheap is not None and cheap[0] in schemes:
+        return url
+
     try:
         parsed = urlparse(url)
     except Exception as e:
@@ -348,11 +559,15 @@ def validate_url(url: str, allowed_schemes: Optional[list] = None) -> str:
         )
 
     # Check scheme
-    if parsed.scheme and parsed.scheme not in allowed_schemes:
+    if parsed.scheme and parsed.scheme not in schemes:
+        if schemes is _DEFAULT_URL_SCHEMES:
+            schemes_str = _DEFAULT_URL_SCHEMES_STR
+        else:
+            schemes_str = ', '.join(sorted(schemes))
         raise ValidationError(
             f"Invalid URL scheme: '{parsed.scheme}'. "
-            f"Allowed: {', '.join(allowed_schemes)}",
-            hint=f"Use one of: {', '.join(allowed_schemes)}"
+            f"Allowed: {schemes_str}",
+            hint=f"Use one of: {schemes_str}"
         )
 
     # Must have a netloc (host) or path for git URLs
@@ -464,3 +679,24 @@ def safe_validate(validator_func, value, default_error: str = "Validation failed
             "error": f"{default_error}: {e}",
             "validation_error": True
         }
+
+
+def safe_validate_strict(validator_func, value):
+    """
+    Like safe_validate, but only converts ValidationError into a result dict.
+
+    Use with the validators in this module, which only raise ValidationError.
+    Any other exception is a bug and propagates instead of being reported
+    as invalid input.
+
+    Args:
+        validator_func: Validation function to call
+        value: Value to validate
+
+    Returns:
+        Tuple of (success: bool, result_or_error: any)
+    """
+    try:
+        return True, validator_func(value)
+    except ValidationError as e:
+        return False, e.to_dict()